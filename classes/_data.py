@@ -0,0 +1,174 @@
+"""
+_data.py - Loads the game's JSON data files in one place
+
+Every data file in the data/ folder (items.json, professions.json, wagons.json)
+is read in a single pass the first time any of them is needed, and the parsed
+results are shared by item.py, person.py and wagon.py.
+The leading underscore in the module name means it's meant for use inside
+the classes package only.
+"""
+
+# Import statements - bring in code from other modules
+import hashlib # For naming cache files after the data file's full path
+import json    # For reading JSON files
+import os      # For file and folder operations
+import pickle  # For the parsed-data cache files (see _load_json)
+
+# orjson is an optional, much faster JSON parser. If it isn't installed,
+# fall back to Python's built-in json module (both accept raw bytes).
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
+# Folder holding the data files - go up one directory from classes/, then into data/
+DATA_DIR = os.path.join(os.path.dirname(__file__), '..', 'data')
+
+# === PARSED-DATA CACHE ===
+# Loading a pickle is much faster than parsing JSON, so after a JSON file is
+# parsed the result is also saved as a pickle cache file. The cache
+# remembers the JSON file's size and modification time, so editing the JSON
+# makes the cache stale and it's rebuilt automatically.
+# Loading a pickle can run code stored inside it, so cache files are only ever
+# read from (and written to) the player's own cache folder - never from data/,
+# where a .pkl file could have been shipped along with the game.
+# Bump _SCHEMA_VERSION whenever the cached format changes to throw away old caches.
+_SCHEMA_VERSION = 1
+
+
+def _cache_dir():
+    """
+    Get this game's folder inside the current user's cache folder
+    
+    Returns:
+        str: e.g. ~/.cache/oregon_trail_fan_build on Linux
+             (%LOCALAPPDATA%\\oregon_trail_fan_build on Windows)
+    """
+    if os.name == 'nt':
+        base = os.environ.get('LOCALAPPDATA') or os.path.join(os.path.expanduser('~'), 'AppData', 'Local')
+    else:
+        # XDG_CACHE_HOME is where Linux users can choose to keep cache files
+        base = os.environ.get('XDG_CACHE_HOME') or os.path.join(os.path.expanduser('~'), '.cache')
+    return os.path.join(base, 'oregon_trail_fan_build')
+
+
+def _cache_path(path):
+    """
+    Get where the cache for one data file is kept
+    
+    The full path of the data file is hashed into the name, so two copies
+    of the game never share (or overwrite) each other's caches.
+    
+    Args:
+        path: Path to the .json file
+        
+    Returns:
+        str: Path to the cache file, e.g. <cache folder>/items-1a2b3c4d5e6f7a8b.pkl
+    """
+    digest = hashlib.sha1(os.path.realpath(path).encode('utf-8')).hexdigest()[:16]
+    name = os.path.basename(path)[:-5]  # Cut off the ".json" ending
+    return os.path.join(_cache_dir(), f"{name}-{digest}.pkl")
+
+# Parsed data, keyed by file name without ".json" (e.g. "professions").
+# Starts empty (None) and is filled in by get_data() on first use.
+_DATA = None
+
+
+def _load_json(path, stat):
+    """
+    Load one JSON file, using its pickle cache when it's up to date
+    
+    Args:
+        path: Path to the .json file
+        stat: os.stat() result for that file (size and modification time)
+        
+    Returns:
+        The parsed data
+    """
+    cache_path = _cache_path(path)
+    # What the cache must have been built from to still be valid
+    key = (_SCHEMA_VERSION, stat.st_mtime_ns, stat.st_size)
+    
+    # Try the cache first. A missing, half-written or otherwise broken cache
+    # just means we parse the JSON instead.
+    try:
+        with open(cache_path, 'rb') as f:
+            cached = pickle.load(f)
+    except (OSError, pickle.UnpicklingError, EOFError, ValueError):
+        cached = None
+    # A good cache is a (key, data) pair - check the shape before unpacking it,
+    # so a file holding something else is just ignored like a broken one
+    if type(cached) is tuple and len(cached) == 2 and cached[0] == key:
+        return cached[1]
+    
+    # Open in binary mode ('rb') and parse the raw bytes
+    with open(path, 'rb') as f:
+        data = _json_loads(f.read())
+    
+    # Save the cache for next time. Write to a temporary file and then rename it,
+    # so a crash halfway through never leaves a broken cache behind.
+    # If the folder can't be made or written to (OSError), just carry on without a cache.
+    temp_path = f"{cache_path}.{os.getpid()}.tmp"
+    try:
+        os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+        with open(temp_path, 'wb') as f:
+            pickle.dump((key, data), f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(temp_path, cache_path)
+    except OSError:
+        try:
+            os.remove(temp_path)
+        except OSError:
+            pass
+    return data
+
+
+def _load_all():
+    """
+    Read and parse every .json file in DATA_DIR
+
+    os.scandir() lists the folder once and already knows which entries are
+    files, so there's no separate check per file.
+
+    Returns:
+        dict: File name without ".json" -> parsed data
+    """
+    data = {}
+    try:
+        entries = os.scandir(DATA_DIR)
+    except FileNotFoundError:
+        # No data folder at all - every lookup will report its file as missing
+        return data
+
+    # "with" closes the folder listing when we're done with it
+    with entries:
+        for entry in entries:
+            if entry.name.endswith('.json') and entry.is_file():
+                try:
+                    parsed = _load_json(entry.path, entry.stat())
+                except (ValueError, OSError):
+                    # One broken or unreadable file shouldn't stop the others from
+                    # loading. (Bad JSON raises a ValueError in both json and orjson.)
+                    # Skip it, so get_data() returns None for that file and the
+                    # module using it prints its "not found or unreadable" warning.
+                    continue
+                # entry.name[:-5] cuts off the ".json" ending
+                data[entry.name[:-5]] = parsed
+    return data
+
+
+def get_data(name):
+    """
+    Get the parsed contents of one data file
+
+    Args:
+        name: File name without ".json", e.g. "professions"
+
+    Returns:
+        The parsed data, or None if data/<name>.json doesn't exist or couldn't be read
+    """
+    # "global" lets this function replace the module-level variable
+    global _DATA
+    if _DATA is None:
+        _DATA = _load_all()
+    return _DATA.get(name)
@@ -5,53 +5,273 @@ This module handles individual health tracking, status effects, and death mechan
 Health is tracked on a 0-100 scale with status flags every 20 points.
 """
 
+import logging
+import math
 import random
-from enum import Enum
-from typing import Dict, List, Optional
+import sys
+from enum import IntEnum
+from types import MappingProxyType
+from typing import Dict, FrozenSet, Iterator, List, NamedTuple, Optional, Tuple, Union
 
+from classes.health_kernels import CONDITION_DAMAGE, daily_damage
+from classes.weather import Weather, parse_weather
 
-class HealthStatus(Enum):
+
+class HealthStatus(IntEnum):
     """
     Health status categories based on 20% increments
     
     Enum is a special class that creates named constants.
     Instead of using numbers like 1, 2, 3, we use meaningful names.
     This makes code more readable and prevents errors.
+    
+    IntEnum members are also plain integers underneath, which makes comparing
+    them and using them as dictionary keys as fast as using numbers.
+    The display text lives in _STATUS_NAMES and is read through .label
     """
     # Each status represents a health range - comments show the numeric ranges
-    EXCELLENT = "Excellent"      # 81-100 health points
-    GOOD = "Good"               # 61-80 health points
-    FAIR = "Fair"               # 41-60 health points
-    POOR = "Poor"               # 21-40 health points
-    CRITICAL = "Critical"       # 1-20 health points
-    DEAD = "Dead"               # 0 health points
+    EXCELLENT = 0    # 81-100 health points
+    GOOD = 1         # 61-80 health points
+    FAIR = 2         # 41-60 health points
+    POOR = 3         # 21-40 health points
+    CRITICAL = 4     # 1-20 health points
+    DEAD = 5         # 0 health points
+    
+    @property
+    def label(self) -> str:
+        """Display text for this status (e.g., "Excellent")"""
+        return _STATUS_NAMES[self]
 
 
-class HealthCondition(Enum):
+class HealthCondition(IntEnum):
     """
     Specific health conditions that can affect party members
     
     These represent different medical conditions or states that characters
     can have. Each condition affects health differently and may require
     different treatments.
+    
+    Like HealthStatus, members are integers underneath; use .label for display text.
     """
     # Base condition - when nothing is wrong
-    HEALTHY = "Healthy"
+    HEALTHY = 0
     
     # Fatigue-related conditions
-    EXHAUSTED = "Exhausted"          # From lack of sleep or overwork
+    EXHAUSTED = 1        # From lack of sleep or overwork
     
     # Nutrition-related conditions  
-    MALNOURISHED = "Malnourished"    # From lack of food over time
+    MALNOURISHED = 2     # From lack of food over time
     
     # Illness conditions
-    SICK = "Sick"                    # General illness (cold, flu, etc.)
-    FEVERISH = "Feverish"           # High temperature, more serious than sick
-    DYSENTERY = "Dysentery"         # Serious intestinal disease (common on trail)
+    SICK = 3             # General illness (cold, flu, etc.)
+    FEVERISH = 4         # High temperature, more serious than sick
+    DYSENTERY = 5        # Serious intestinal disease (common on trail)
     
     # Injury conditions
-    INJURED = "Injured"             # General wounds or trauma
-    BROKEN_BONE = "Broken Bone"     # Serious injury requiring long recovery
+    INJURED = 6          # General wounds or trauma
+    BROKEN_BONE = 7      # Serious injury requiring long recovery
+    
+    @property
+    def label(self) -> str:
+        """Display text for this condition (e.g., "Broken Bone")"""
+        return _CONDITION_NAMES[self]
+
+
+# Fixed labels used when explaining daily health changes
+# sys.intern() keeps one shared copy of each string
+_REASON_FOOD = sys.intern("Lack of food")
+_REASON_REST = sys.intern("Lack of rest")
+_REASON_HEALING = sys.intern("Natural healing")
+
+# Display text for each enum member, indexed by its integer value
+_STATUS_NAMES = ("Excellent", "Good", "Fair", "Poor", "Critical", "Dead")
+_CONDITION_NAMES = (
+    "Healthy", "Exhausted", "Malnourished", "Sick",
+    "Feverish", "Dysentery", "Injured", "Broken Bone",
+)
+
+
+# Module logger - the program running the game decides what gets shown
+# (e.g. logging.basicConfig(level=logging.INFO) to see health changes)
+_log = logging.getLogger(__name__)
+
+# === RANDOM NUMBERS ===
+# One random number generator shared by every Health object.
+# Binding its methods to module names once skips the "random." lookup on every roll.
+# Call _rng.seed(...) to make a simulation repeatable.
+_rng = random.Random()
+_random = _rng.random
+_getrandbits = _rng.getrandbits
+
+
+def _roll(low: int, high: int, bits: int) -> int:
+    """
+    Random whole number from low to high (inclusive), like random.randint
+    
+    randint goes through several layers of Python code on every call.
+    For our small fixed ranges it's quicker to grab a few random bits
+    directly and retry the rare values that fall outside the range.
+    
+    Args:
+        low: Smallest possible result
+        high: Largest possible result
+        bits: Random bits to draw - must be enough to count up to high - low
+    """
+    span = high - low + 1
+    value = _getrandbits(bits)
+    while value >= span:  # Out of range - throw it away and draw again
+        value = _getrandbits(bits)
+    return low + value
+
+
+# === STATUS LOOKUP TABLE ===
+# Health is bounded 0-100, so instead of walking an if/elif ladder every time
+# we need a status, we build a tuple once where index = health points.
+# Index 0 is DEAD, 1-20 CRITICAL, 21-40 POOR, 41-60 FAIR, 61-80 GOOD, 81-100 EXCELLENT.
+_STATUS_LUT = tuple(
+    HealthStatus.DEAD if h == 0
+    else HealthStatus.CRITICAL if h <= 20
+    else HealthStatus.POOR if h <= 40
+    else HealthStatus.FAIR if h <= 60
+    else HealthStatus.GOOD if h <= 80
+    else HealthStatus.EXCELLENT
+    for h in range(101)
+)
+
+# === SURVIVAL LOOKUP TABLE ===
+# Daily survival chance by health points, built the same way as _STATUS_LUT.
+# 0 = certain death, 1-10 = 70%, 11-20 = 90%, 21-100 = 99%
+_SURVIVAL_LUT = tuple(
+    0.0 if h == 0
+    else 0.7 if h <= 10
+    else 0.9 if h <= 20
+    else 0.99
+    for h in range(101)
+)
+
+# === EFFECT TABLES ===
+# These never change, so they are built once here instead of on every call.
+# MappingProxyType wraps a dictionary in a read-only view so nothing can edit it by accident.
+
+# Base damage for each weather type, indexed by Weather number
+# (_WEATHER_DAMAGE[Weather.SNOW] is a plain tuple lookup, no string hashing)
+_WEATHER_DAMAGE = (
+    1,   # CLEAR - fair or unknown weather still wears people down a little
+    2,   # RAIN - mild damage
+    3,   # HOT - moderate damage
+    4,   # COLD - more damage
+    6,   # SNOW - significant damage
+    8,   # STORM - the most damage
+)
+
+# How much damage each condition does per day. The numbers live in
+# health_kernels.CONDITION_DAMAGE (where the compiled daily arithmetic reads them);
+# this gives them by condition, leaving out the ones that do no damage.
+_CONDITION_EFFECTS = MappingProxyType({
+    condition: damage
+    for condition, damage in zip(HealthCondition, CONDITION_DAMAGE)
+    if damage
+})
+
+# === CONDITION BITS ===
+# Each condition gets its own bit in a single integer (a "bitmask"):
+# HEALTHY = 0b1, EXHAUSTED = 0b10, MALNOURISHED = 0b100, and so on.
+# Checking, adding and removing a condition is then one bitwise operation:
+#   mask & bit   -> does the character have it?
+#   mask | bit   -> add it
+#   mask & ~bit  -> remove it
+_CONDITION_BITS = MappingProxyType({condition: 1 << condition for condition in HealthCondition})
+_HEALTHY_BIT = _CONDITION_BITS[HealthCondition.HEALTHY]
+
+# Every condition, indexed by its number - turns a bit position back into a condition
+_CONDITIONS = tuple(HealthCondition)
+
+# Daily damage indexed by condition number (HEALTHY = 0 does no damage)
+# Reading _CONDITION_DAMAGE[condition] is a plain tuple lookup, no hashing needed
+_CONDITION_DAMAGE = CONDITION_DAMAGE
+
+
+class HealthSnapshot(NamedTuple):
+    """
+    A frozen copy of one Health object's state
+    
+    A NamedTuple is a tuple whose positions also have names, so it's small,
+    can't be changed, and can be saved or compared easily.
+    Made by Health.snapshot() and turned back into a Health by Health.from_snapshot().
+    """
+    current_health: float
+    max_health: int
+    constitution_bonus: int
+    days_without_food: int
+    days_without_rest: int
+    cond_mask: int                              # Condition bitmask (see _CONDITION_BITS)
+    condition_timers: Tuple[Tuple[int, int], ...]  # (condition number, days remaining) pairs
+    is_alive: bool
+
+
+def weather_exposure_damage(weather: Union[Weather, str], protection_level: float = 1.0) -> float:
+    """
+    Work out how much damage a weather type does at a given protection level
+    
+    Args:
+        weather: Weather value (text like "rain" is converted with parse_weather)
+        protection_level: How well protected (0.0 = no protection, 1.0 = full protection)
+        
+    Returns:
+        float: Damage to apply (0 or less means no exposure)
+    """
+    # Look up the base damage for this weather type in the module-level table
+    # (parse_weather returns Weather values unchanged, so callers that already
+    # converted the text skip the string work entirely)
+    base_damage = _WEATHER_DAMAGE[parse_weather(weather)]
+    
+    # Calculate actual damage based on protection level
+    # (1.0 - protection_level) gives the exposure amount
+    # Full protection (1.0) means no exposure: (1.0 - 1.0) = 0
+    # No protection (0.0) means full exposure: (1.0 - 0.0) = 1.0
+    return base_damage * (1.0 - protection_level)
+
+
+def _daily_reason(food_days: int, rest_days: int, cond_mask: int, healing: int) -> str:
+    """
+    Describe what caused a day's health change (only used for logging)
+    
+    Args:
+        food_days: Days without enough food
+        rest_days: Days without enough rest
+        cond_mask: Condition bitmask for the day
+        healing: Natural healing applied (0 if none)
+        
+    Returns:
+        str: Text like "Lack of food: -4, Sick: -3"
+    """
+    # List of (label, amount) pairs explaining the change
+    reasons: List[Tuple[str, float]] = []
+    if food_days > 0:
+        reasons.append((_REASON_FOOD, -(food_days * 2)))
+    if rest_days > 0:
+        reasons.append((_REASON_REST, -(rest_days * 1.5)))
+    
+    # Walk the set bits of the condition mask one at a time
+    while cond_mask:
+        bit = cond_mask & -cond_mask  # Lowest set bit
+        cond_mask ^= bit              # Clear it so the loop moves on
+        # The bit's position is the condition number (bit 0b1000 -> condition 3)
+        condition = bit.bit_length() - 1
+        damage = _CONDITION_DAMAGE[condition]
+        if damage:
+            reasons.append((_CONDITION_NAMES[condition], damage))
+    
+    if healing:
+        reasons.append((_REASON_HEALING, healing))
+    
+    # {amount:+} always shows the sign: -4 becomes "-4", 2 becomes "+2"
+    if len(reasons) == 1:
+        # Usually there's just one reason - format it directly, no join needed
+        label, amount = reasons[0]
+        return f"{label}: {amount:+}"
+    # Join all reasons with commas: ["reason1", "reason2"] becomes "reason1, reason2"
+    return ", ".join(f"{label}: {amount:+}" for label, amount in reasons)
 
 
 class Health:
@@ -67,7 +287,24 @@ class Health:
     - Base constitution from profession
     """
     
-    def __init__(self, initial_health: int = 100, constitution_bonus: int = 0):
+    # __slots__ lists every attribute a Health object can have.
+    # Python then stores them in fixed slots instead of a per-object dictionary,
+    # which uses less memory and makes reading self.current_health faster.
+    # Any new attribute set in __init__ must be added here too.
+    __slots__ = (
+        "current_health",
+        "max_health",
+        "constitution_bonus",
+        "days_without_food",
+        "days_without_rest",
+        "_cond_mask",
+        "daily_food_requirement",
+        "daily_rest_requirement",
+        "condition_timers",
+        "is_alive",
+    )
+    
+    def __init__(self, initial_health: int = 100, constitution_bonus: int = 0) -> None:
         """
         Initialize health system for an individual
         
@@ -81,25 +318,26 @@ class Health:
         # max() and min() ensure health stays within valid bounds (0-100)
         # max(0, ...) prevents negative health
         # min(100, ...) prevents health over the base maximum
-        self.current_health = max(0, min(100, initial_health + constitution_bonus))
+        self.current_health: float = max(0, min(100, initial_health + constitution_bonus))
         
         # Maximum health this character can have (base 100 + profession bonus)
-        self.max_health = 100 + constitution_bonus
+        self.max_health: int = 100 + constitution_bonus
         
         # Store the bonus for reference (used in healing calculations)
-        self.constitution_bonus = constitution_bonus
+        self.constitution_bonus: int = constitution_bonus
         
         # Tracking factors - these count consecutive days of problems
-        self.days_without_food = 0    # Counter: days with insufficient food
-        self.days_without_rest = 0    # Counter: days with insufficient sleep
+        self.days_without_food: int = 0    # Counter: days with insufficient food
+        self.days_without_rest: int = 0    # Counter: days with insufficient sleep
         
-        # List to track current health conditions
-        # Starts with [HealthCondition.HEALTHY] - a list with one item
-        self.conditions: List[HealthCondition] = [HealthCondition.HEALTHY]
+        # Bitmask of current health conditions (see _CONDITION_BITS above)
+        # Starts with only the HEALTHY bit set
+        # Read it through the "conditions" property or has_condition()
+        self._cond_mask: int = _HEALTHY_BIT
         
         # Daily requirements - these are the minimum needed per day
-        self.daily_food_requirement = 2.0  # pounds of food per day
-        self.daily_rest_requirement = 8    # hours of sleep per day
+        self.daily_food_requirement: float = 2.0  # pounds of food per day
+        self.daily_rest_requirement: int = 8    # hours of sleep per day
         
         # Dictionary to track how long temporary conditions last
         # Key = condition, Value = days remaining
@@ -107,29 +345,69 @@ class Health:
         self.condition_timers: Dict[HealthCondition, int] = {}
         
         # Boolean flag - True means alive, False means dead
-        self.is_alive = True
+        self.is_alive: bool = True
+    
+    @property
+    def conditions(self) -> FrozenSet[HealthCondition]:
+        """
+        Current health conditions as a read-only set
+        
+        @property lets callers write health.conditions like a normal attribute
+        while we build the set from the bitmask on demand.
+        Use add_condition()/remove_condition() to change conditions.
+        """
+        mask = self._cond_mask
+        return frozenset(c for c, bit in _CONDITION_BITS.items() if mask & bit)
+    
+    def has_condition(self, condition: HealthCondition) -> bool:
+        """
+        Check whether this character currently has a condition
+        
+        Args:
+            condition: The condition to look for
+        """
+        return bool(self._cond_mask & _CONDITION_BITS[condition])
+    
+    def active_conditions(self) -> Iterator[HealthCondition]:
+        """
+        Go through every current condition except HEALTHY, lowest number first
+        
+        This is a generator (it uses yield), so it hands back one condition at
+        a time straight from the bitmask without building a set.
+        Example: [c.label for c in health.active_conditions()] -> ["Sick", "Feverish"]
+        """
+        # Drop the HEALTHY bit, then walk the remaining set bits one at a time
+        mask = self._cond_mask & ~_HEALTHY_BIT
+        while mask:
+            bit = mask & -mask  # Lowest set bit
+            mask ^= bit         # Clear it so the loop moves on
+            # The bit's position is the condition number (bit 0b1000 -> condition 3)
+            yield _CONDITIONS[bit.bit_length() - 1]
+    
+    def condition_count(self) -> int:
+        """
+        Number of current conditions (HEALTHY counts as one)
+        
+        Same as len(health.conditions), but just counts the set bits in the mask.
+        """
+        # bin() writes the mask as text like "0b101", so counting the "1"s counts the set bits
+        return bin(self._cond_mask).count("1")
     
     def get_status(self) -> HealthStatus:
         """
         Get current health status category
         
         -> HealthStatus means this function returns a HealthStatus enum value
-        This uses if/elif/else to check health ranges and return appropriate status.
+        This uses a precomputed lookup table (_STATUS_LUT) indexed by health points,
+        so it's a single lookup - cheap enough to do every time it's asked.
         """
         # Check death first - if not alive OR health is 0 or below
         if not self.is_alive or self.current_health <= 0:
             return HealthStatus.DEAD
-        # elif means "else if" - only check this if the previous condition was false
-        elif self.current_health <= 20:
-            return HealthStatus.CRITICAL
-        elif self.current_health <= 40:
-            return HealthStatus.POOR
-        elif self.current_health <= 60:
-            return HealthStatus.FAIR
-        elif self.current_health <= 80:
-            return HealthStatus.GOOD
-        else:  # If none of the above conditions are true, health must be > 80
-            return HealthStatus.EXCELLENT
+        # Health can be fractional (e.g. 20.5), so round up before indexing:
+        # 20.5 is above 20 and belongs in the next bucket, same as the old "<= 20" check.
+        # min(..., 100) covers profession bonuses that push max health above 100.
+        return _STATUS_LUT[min(math.ceil(self.current_health), 100)]
     
     def get_health_description(self) -> str:
         """
@@ -146,21 +424,18 @@ class Health:
             return "Dead"
         
         # Build description string: "Status (current/max)"
-        # .value gets the string value from the enum (e.g., "Excellent")
+        # .label gets the display text for the enum (e.g., "Excellent")
         # f"..." is an f-string - puts variable values into the text
-        description = f"{status.value} ({self.current_health}/100)"
+        description = f"{status.label} ({self.current_health}/100)"
         
         # Add active conditions (excluding healthy)
-        # List comprehension: [item for item in list if condition]
-        # This creates a new list with only conditions that aren't HEALTHY
-        active_conditions = [c for c in self.conditions if c != HealthCondition.HEALTHY]
-        
-        # if active_conditions: checks if the list has any items
-        if active_conditions:
-            # Get the string names of all conditions
-            condition_names = [c.value for c in active_conditions]
+        # Skip the work entirely when the mask holds nothing but the HEALTHY bit
+        if self._cond_mask != _HEALTHY_BIT:
+            # Names of every active condition except HEALTHY, in the order
+            # they're defined in the enum
+            condition_names = [condition.label for condition in self.active_conditions()]
             # ', '.join() combines list items with commas: ["A", "B"] becomes "A, B"
-            description += f" - {', '.join(condition_names)}"
+            description += " - " + ", ".join(condition_names)
         
         return description
     
@@ -211,7 +486,7 @@ class Health:
             self.days_without_rest += 1
             return False
     
-    def add_condition(self, condition: HealthCondition, duration_days: int = 0):
+    def add_condition(self, condition: HealthCondition, duration_days: int = 0) -> None:
         """
         Add a health condition to this character
         
@@ -219,17 +494,13 @@ class Health:
             condition: The condition to add (e.g., HealthCondition.SICK)
             duration_days: Days until condition resolves (0 = permanent until treated)
         """
-        # Only add the condition if it's not already in the list
-        # "not in" checks if something is NOT in a list
-        if condition not in self.conditions:
-            # .append() adds an item to the end of a list
-            self.conditions.append(condition)
+        # | turns the condition's bit on (adding one that's already there does nothing)
+        self._cond_mask |= _CONDITION_BITS[condition]
             
         # Remove healthy status if adding a negative condition
-        # If we're adding something other than HEALTHY, and HEALTHY is in the list
-        if condition != HealthCondition.HEALTHY and HealthCondition.HEALTHY in self.conditions:
-            # .remove() takes an item out of a list
-            self.conditions.remove(HealthCondition.HEALTHY)
+        # & ~ turns the HEALTHY bit off
+        if condition != HealthCondition.HEALTHY:
+            self._cond_mask &= ~_HEALTHY_BIT
         
         # Set timer for temporary conditions
         # If duration_days is greater than 0, this condition will automatically go away
@@ -237,16 +508,15 @@ class Health:
             # Add to the dictionary: condition_timers[condition] = duration_days
             self.condition_timers[condition] = duration_days
     
-    def remove_condition(self, condition: HealthCondition):
+    def remove_condition(self, condition: HealthCondition) -> None:
         """
         Remove a health condition from this character
         
         Args:
             condition: The condition to remove
         """
-        # Remove from conditions list if it exists
-        if condition in self.conditions:
-            self.conditions.remove(condition)
+        # Turn the condition's bit off (does nothing if it wasn't set)
+        self._cond_mask &= ~_CONDITION_BITS[condition]
             
         # Remove from timers dictionary if it exists
         # "in" works with dictionaries too - it checks the keys
@@ -255,11 +525,11 @@ class Health:
             del self.condition_timers[condition]
         
         # If no negative conditions remain, set character back to healthy
-        # len() gets the length/size of a list
-        if len(self.conditions) == 0:
-            self.conditions.append(HealthCondition.HEALTHY)
+        # A mask of 0 means no bits are set
+        if self._cond_mask == 0:
+            self._cond_mask = _HEALTHY_BIT
     
-    def apply_medicine(self, medicine_type: str, effectiveness: float = 0.8):
+    def apply_medicine(self, medicine_type: str, effectiveness: float = 0.8) -> None:
         """
         Apply medicine or treatment to this character
         
@@ -268,17 +538,17 @@ class Health:
             effectiveness: How effective the treatment is (0.0-1.0, where 1.0 = 100% effective)
         """
         # Calculate healing amount using random number generation
-        # random.randint(5, 15) gives a random integer between 5 and 15 (inclusive)
+        # _roll(5, 15, 4) gives a random integer between 5 and 15 (inclusive), using 4 random bits
         # Multiply by effectiveness to reduce healing if medicine isn't fully effective
-        healing = random.randint(5, 15) * effectiveness
+        healing = _roll(5, 15, 4) * effectiveness
         
         # Apply the healing using our modify_health method
         self.modify_health(healing, f"Medicine: {medicine_type}")
         
         # Chance to cure specific conditions
-        # random.random() gives a decimal between 0.0 and 1.0
+        # _random() gives a decimal between 0.0 and 1.0
         # If it's less than effectiveness, the medicine successfully cures a condition
-        if random.random() < effectiveness:
+        if _random() < effectiveness:
             # List of conditions that medicine can cure
             curable_conditions = [
                 HealthCondition.SICK, 
@@ -290,56 +560,47 @@ class Health:
             # Loop through each curable condition
             for condition in curable_conditions:
                 # If the character has this condition
-                if condition in self.conditions:
+                if self.has_condition(condition):
                     # Remove it and stop looking (break exits the loop)
                     self.remove_condition(condition)
                     break  # Only cure one condition per medicine use
     
-    def apply_weather_exposure(self, weather: str, protection_level: float = 1.0):
+    def apply_weather_exposure(self, weather: Union[Weather, str], protection_level: float = 1.0) -> None:
         """
         Apply weather effects to this character
         
         Args:
-            weather: Weather type (hot, cold, rain, etc.)
+            weather: Weather value or text (hot, cold, rain, etc.)
             protection_level: How well protected (0.0 = no protection, 1.0 = full protection)
         """
-        exposure_damage = 0  # Start with no damage
-        
-        # Dictionary mapping weather types to base damage amounts
-        # Dictionaries use {key: value} syntax
-        weather_effects = {
-            "hot": 3,      # Hot weather causes moderate damage
-            "cold": 4,     # Cold weather causes more damage
-            "rain": 2,     # Rain causes mild damage
-            "snow": 6,     # Snow causes significant damage
-            "storm": 8     # Storms cause the most damage
-        }
-        
-        # Look up the base damage for this weather type
-        # .get() safely gets a value from a dictionary, with a default if key doesn't exist
-        # .lower() converts the string to lowercase to handle "Rain", "RAIN", "rain" all the same
-        base_damage = weather_effects.get(weather.lower(), 1)  # Default to 1 if weather not found
+        weather = parse_weather(weather)
+        self.apply_exposure_damage(weather_exposure_damage(weather, protection_level), weather)
+    
+    def apply_exposure_damage(self, exposure_damage: float, weather: Weather) -> None:
+        """
+        Apply weather damage that has already been worked out
         
-        # Calculate actual damage based on protection level
-        # (1.0 - protection_level) gives the exposure amount
-        # Full protection (1.0) means no exposure: (1.0 - 1.0) = 0
-        # No protection (0.0) means full exposure: (1.0 - 0.0) = 1.0
-        exposure_damage = base_damage * (1.0 - protection_level)
+        Party-wide weather uses this so the damage is calculated once for
+        everyone instead of once per person (see weather_exposure_damage).
         
+        Args:
+            exposure_damage: Damage after protection (from weather_exposure_damage)
+            weather: Weather type (for logging)
+        """
         # Only apply damage if there's actual exposure
         if exposure_damage > 0:
             # Apply negative health change (- makes it negative)
-            self.modify_health(-exposure_damage, f"Weather exposure: {weather}")
+            self.modify_health(-exposure_damage, f"Weather exposure: {weather.label}")
             
             # Chance of getting sick from exposure
             # Higher exposure damage = higher chance of getting sick
             # exposure_damage / 20 converts damage to a probability (0.0 to 1.0)
-            if random.random() < (exposure_damage / 20):
+            if _random() < (exposure_damage / 20):
                 # Add sick condition for 3-7 days
-                # random.randint(3, 7) gives a random number between 3 and 7
-                self.add_condition(HealthCondition.SICK, duration_days=random.randint(3, 7))
+                # _roll(3, 7, 3) gives a random number between 3 and 7
+                self.add_condition(HealthCondition.SICK, duration_days=_roll(3, 7, 3))
     
-    def daily_health_update(self):
+    def daily_health_update(self) -> None:
         """
         Process daily health changes based on current conditions
         This should be called once per game day to update the character's health.
@@ -348,68 +609,54 @@ class Health:
         if not self.is_alive:
             return  # return exits the function early
         
-        health_change = 0  # Track total health change for the day
-        reasons = []       # List to store reasons for health changes (for logging)
-        
-        # === FOOD EFFECTS ===
-        # Check if character has gone days without enough food
-        if self.days_without_food > 0:
-            # Damage increases each day: day 1 = -2, day 2 = -4, day 3 = -6, etc.
-            malnutrition_damage = self.days_without_food * 2
-            health_change -= malnutrition_damage  # -= means "subtract from"
-            reasons.append(f"Lack of food: -{malnutrition_damage}")
-            
-            # Add malnourished condition after 2 days without food
-            if self.days_without_food >= 2:
-                self.add_condition(HealthCondition.MALNOURISHED)
-        
-        # === REST EFFECTS ===
-        # Check if character has gone days without enough rest
-        if self.days_without_rest > 0:
-            # Exhaustion damage: 1.5 points per day without rest
-            exhaustion_damage = self.days_without_rest * 1.5
-            health_change -= exhaustion_damage
-            reasons.append(f"Lack of rest: -{exhaustion_damage}")
-            
-            # Add exhausted condition after just 1 day without rest
-            if self.days_without_rest >= 1:
-                self.add_condition(HealthCondition.EXHAUSTED)
-        
-        # === CONDITION EFFECTS ===
-        # Dictionary showing how much damage each condition does per day
-        condition_effects = {
-            HealthCondition.SICK: -3,           # Mild illness
-            HealthCondition.INJURED: -2,        # Physical injury
-            HealthCondition.FEVERISH: -4,       # More serious illness
-            HealthCondition.BROKEN_BONE: -1,    # Slow healing injury
-            HealthCondition.DYSENTERY: -5,      # Serious disease
-            HealthCondition.MALNOURISHED: -2,   # Ongoing nutrition problems
-            HealthCondition.EXHAUSTED: -1       # Fatigue effects
-        }
+        # Fast path: a fully healthy, well-fed, well-rested character at max health
+        # has nothing to process today (no damage, no healing, no timers)
+        if (self.current_health >= self.max_health
+                and self._cond_mask == _HEALTHY_BIT
+                and self.days_without_food == 0
+                and self.days_without_rest == 0
+                and not self.condition_timers):
+            return
         
-        # Loop through each condition the character currently has
-        for condition in self.conditions:
-            # Check if this condition causes damage
-            if condition in condition_effects:
-                # Get the damage amount (negative number)
-                damage = condition_effects[condition]
-                health_change += damage  # Add the damage (which is negative)
-                reasons.append(f"{condition.value}: {damage}")
+        food_days = self.days_without_food
+        rest_days = self.days_without_rest
+        
+        # === NEW CONDITIONS ===
+        # Add malnourished condition after 2 days without food
+        if food_days >= 2:
+            self.add_condition(HealthCondition.MALNOURISHED)
+        # Add exhausted condition after just 1 day without rest
+        if rest_days >= 1:
+            self.add_condition(HealthCondition.EXHAUSTED)
+        
+        # === FOOD, REST AND CONDITION EFFECTS ===
+        # Hunger and condition damage live in health_kernels.daily_damage
+        # (see that module) and always come back as a whole number
+        mask = self._cond_mask
+        health_change: float = daily_damage(food_days, mask)
+        # Exhaustion: 1.5 points per day without rest
+        # (only added when rest was missed, so an all-whole-number day stays whole)
+        if rest_days:
+            health_change -= rest_days * 1.5
         
         # === NATURAL HEALING ===
         # Healthy characters slowly recover on their own
         # Check if character is healthy AND below maximum health
-        if HealthCondition.HEALTHY in self.conditions and self.current_health < self.max_health:
+        healing = 0
+        if mask & _HEALTHY_BIT and self.current_health < self.max_health:
             # Random healing between 1-3 points per day
-            healing = random.randint(1, 3)
+            healing = _roll(1, 3, 2)
             health_change += healing  # Add positive healing
-            reasons.append(f"Natural healing: +{healing}")
         
         # === APPLY ALL CHANGES ===
         # Only modify health if there was some change
         if health_change != 0:
-            # Join all reasons with commas: ["reason1", "reason2"] becomes "reason1, reason2"
-            self.modify_health(health_change, ", ".join(reasons))
+            reason = ""
+            # modify_health only logs changes of 5 or more, so only build the text
+            # when it will be logged and someone is listening
+            if abs(health_change) >= 5 and _log.isEnabledFor(logging.INFO):
+                reason = _daily_reason(food_days, rest_days, mask, healing)
+            self.modify_health(health_change, reason)
         
         # === UPDATE TIMERS ===
         # Handle temporary conditions (reduce their remaining time)
@@ -420,7 +667,7 @@ class Health:
         if self.current_health <= 0:
             self._handle_death()
     
-    def modify_health(self, amount: int, reason: str = ""):
+    def modify_health(self, amount: float, reason: str = "") -> None:
         """
         Modify health by a specific amount
         
@@ -436,45 +683,46 @@ class Health:
         old_health = self.current_health
         
         # Calculate new health, keeping it within valid bounds
-        # max(0, ...) prevents health from going below 0
-        # min(self.max_health, ...) prevents health from going above maximum
-        self.current_health = max(0, min(self.max_health, self.current_health + amount))
+        # Plain comparisons are cheaper here than calling max() and min()
+        new_health = self.current_health + amount
+        if new_health < 0:
+            new_health = 0                  # Health can't go below 0
+        elif new_health > self.max_health:
+            new_health = self.max_health    # Health can't go above maximum
+        self.current_health = new_health
         
         # Log significant changes for debugging/information
         # abs() gets the absolute value (removes negative sign)
         # Only log changes of 5 or more points to avoid spam
+        # %s placeholders are only filled in if the message is actually shown
         if abs(amount) >= 5:
-            print(f"Health change: {old_health} -> {self.current_health} ({reason})")
+            _log.info("Health change: %s -> %s (%s)", old_health, self.current_health, reason)
     
-    def _update_condition_timers(self):
+    def _update_condition_timers(self) -> None:
         """
         Update and remove expired temporary conditions
         
         Methods starting with _ are "private" - meant for internal use only.
         This is called automatically by daily_health_update().
         """
-        expired_conditions = []  # List to store conditions that have expired
+        timers = self.condition_timers
         
-        # Loop through each condition that has a timer
-        # .items() gets both the key and value from a dictionary
-        for condition, days_remaining in self.condition_timers.items():
-            # Reduce the timer by 1 day
-            days_remaining -= 1
-            
-            # Check if the condition has expired (timer reached 0)
-            if days_remaining <= 0:
-                # Add to expired list (we'll remove these after the loop)
-                expired_conditions.append(condition)
-            else:
-                # Update the timer with the new value
-                self.condition_timers[condition] = days_remaining
-        
-        # Remove all expired conditions
-        # We do this in a separate loop to avoid changing the dictionary while iterating
+        # Find conditions on their last day (1 day left becomes 0 after today)
+        # List comprehension: [item for item in collection if condition]
+        expired_conditions: List[HealthCondition] = [
+            condition for condition, days_remaining in timers.items() if days_remaining <= 1
+        ]
+        
+        # Remove all expired conditions first (this also deletes their timers)
+        # We build the list before removing to avoid changing the dictionary while iterating
         for condition in expired_conditions:
             self.remove_condition(condition)
+        
+        # Every timer still left just loses one day, updated in place
+        for condition in timers:
+            timers[condition] -= 1
     
-    def _handle_death(self):
+    def _handle_death(self) -> None:
         """
         Handle character death
         
@@ -482,8 +730,86 @@ class Health:
         """
         self.is_alive = False        # Set alive flag to False
         self.current_health = 0      # Ensure health is exactly 0
-        self.conditions = []         # Clear all conditions (dead people have no conditions)
-        print(f"Character has died.")  # Print death message
+        self._cond_mask = 0          # Clear all conditions (dead people have no conditions)
+        _log.info("Character has died.")  # Log death message
+    
+    def snapshot(self) -> HealthSnapshot:
+        """
+        Capture this character's health state
+        
+        Useful for save games, undoing a day, or trying out "what if" simulations
+        without copying the whole object.
+        
+        Returns:
+            HealthSnapshot: Read-only copy of the current state
+        """
+        return HealthSnapshot(
+            self.current_health,
+            self.max_health,
+            self.constitution_bonus,
+            self.days_without_food,
+            self.days_without_rest,
+            self._cond_mask,
+            tuple((int(condition), days) for condition, days in self.condition_timers.items()),
+            self.is_alive,
+        )
+    
+    @classmethod
+    def from_snapshot(cls, snap: HealthSnapshot) -> "Health":
+        """
+        Rebuild a Health object from a snapshot
+        
+        @classmethod means this is called on the class itself: Health.from_snapshot(snap)
+        
+        Args:
+            snap: A snapshot made by snapshot()
+            
+        Returns:
+            Health: A new object in exactly the saved state
+        """
+        health = cls(constitution_bonus=snap.constitution_bonus)
+        health.current_health = snap.current_health
+        health.max_health = snap.max_health
+        health.days_without_food = snap.days_without_food
+        health.days_without_rest = snap.days_without_rest
+        health._cond_mask = snap.cond_mask
+        health.condition_timers = {
+            HealthCondition(condition): days for condition, days in snap.condition_timers
+        }
+        health.is_alive = snap.is_alive
+        return health
+    
+    def __copy__(self) -> "Health":
+        """
+        Make an independent copy of this Health object
+        
+        copy.copy(health) calls this. Plain numbers and flags are shared safely,
+        but condition_timers is a dictionary that gets changed in place, so the
+        copy gets its own. Person uses this to start new characters from a
+        per-profession template (see person.py).
+        
+        Returns:
+            Health: A new object in the same state
+        """
+        # cls.__new__ makes an empty object without running __init__
+        cls = type(self)
+        health = cls.__new__(cls)
+        # Each class only lists its own __slots__, so walk every class in the
+        # MRO (the class, its parents, ..., object) to copy a subclass's slots too
+        for klass in cls.__mro__:
+            slots = klass.__dict__.get("__slots__", ())
+            if isinstance(slots, str):
+                slots = (slots,)  # __slots__ = "name" is allowed and means one slot
+            for name in slots:
+                # __dict__ and __weakref__ are handled below / not copied;
+                # unset slots stay unset on the copy
+                if name not in ("__dict__", "__weakref__") and hasattr(self, name):
+                    setattr(health, name, getattr(self, name))
+        # Subclasses without __slots__ keep extra attributes in a __dict__
+        if hasattr(self, "__dict__"):
+            health.__dict__.update(self.__dict__)
+        health.condition_timers = dict(self.condition_timers)
+        return health
     
     def get_survival_chance(self) -> float:
         """
@@ -498,17 +824,13 @@ class Health:
         # Dead characters have no survival chance
         if self.current_health <= 0:
             return 0.0
-        # Very low health: 30% chance of death per day
-        elif self.current_health <= 10:
-            return 0.7  # 70% survival chance
-        # Critical health: 10% chance of death per day  
-        elif self.current_health <= 20:
-            return 0.9  # 90% survival chance
-        else:
-            # Above critical: very low chance of random death
-            return 0.99  # 99% survival chance
+        # Look up the chance in _SURVIVAL_LUT (rounding fractional health up, like get_status)
+        # Very low health (1-10): 30% chance of death per day
+        # Critical health (11-20): 10% chance of death per day
+        # Above critical: very low chance of random death
+        return _SURVIVAL_LUT[min(math.ceil(self.current_health), 100)]
     
-    def __str__(self):
+    def __str__(self) -> str:
         """
         String representation of health status
         
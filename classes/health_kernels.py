@@ -0,0 +1,73 @@
+"""
+health_kernels.py - Pure number-crunching helpers for the health system
+
+The functions here only take and return plain numbers (and tuples of numbers),
+never Health objects, strings or enums. That keeps the daily arithmetic in one
+place and lets it be compiled to machine code by numba when numba is installed.
+Without numba they run as normal Python, so the game needs nothing extra.
+numba (like orjson in _data.py) is only ever an optional speed-up: results
+are the same with or without it.
+"""
+
+from typing import Any, Callable, Tuple, TypeVar
+
+# Any function type - lets the njit stand-in say "gives back what it was given"
+_F = TypeVar("_F", bound=Callable[..., Any])
+
+# numba is an optional compiler for numeric Python code. If it isn't installed,
+# njit becomes a decorator that hands the function back unchanged.
+try:
+    from numba import njit
+except ImportError:
+    def njit(*args: Any, **kwargs: Any) -> Any:
+        """
+        Stand-in for numba.njit that leaves the function as plain Python
+        
+        Returns:
+            The function itself (bare @njit), or a decorator of type
+            Callable[[_F], _F] that returns its function unchanged (@njit(...))
+        """
+        # Used bare (@njit): the function itself is the first argument
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        # Used with options (@njit(cache=True)): return a decorator that does nothing
+        def decorator(func: _F) -> _F:
+            return func
+        return decorator
+
+
+# Daily damage indexed by condition number - the same order as HealthCondition
+# in health.py (HEALTHY, EXHAUSTED, MALNOURISHED, SICK, FEVERISH, DYSENTERY,
+# INJURED, BROKEN_BONE). A module constant instead of an argument, so numba
+# builds it into the compiled code once instead of reading a tuple on every call.
+CONDITION_DAMAGE: Tuple[int, ...] = (0, -1, -2, -3, -4, -5, -2, -1)
+
+
+@njit(cache=True)
+def daily_damage(days_without_food: int, cond_mask: int) -> int:
+    """
+    Work out one day's health change from hunger and conditions
+    
+    Exhaustion (1.5 points per day without rest) is added by
+    Health.daily_health_update, so the result here is always a whole number
+    and whole-number days stay whole whether or not numba is installed.
+    
+    Args:
+        days_without_food: Days in a row without enough food
+        cond_mask: Condition bitmask (bit N set = condition number N)
+        
+    Returns:
+        int: Health change for the day, before exhaustion and natural healing (0 or negative)
+    """
+    # Hunger: day 1 = -2, day 2 = -4, day 3 = -6, etc.
+    change = -(days_without_food * 2)
+    
+    # Add the damage of every condition whose bit is set,
+    # checking the lowest bit and then shifting the mask down by one each time
+    condition = 0
+    while cond_mask:
+        if cond_mask & 1:
+            change += CONDITION_DAMAGE[condition]
+        cond_mask >>= 1
+        condition += 1
+    return change
@@ -6,8 +6,66 @@ tracking weight, and simulating food spoilage based on weather and time.
 """
 
 # Import statements - bring in code from other modules
+import logging     # For optional status messages (see the verbose flag)
 import random      # For random number generation (used in spoilage simulation)
 from datetime import datetime  # For date handling (used in spoilage calculations)
+from classes.weather import Weather, parse_weather  # Weather types
+
+# Module logger - the program running the game decides where messages go
+_log = logging.getLogger(__name__)
+
+# === SPOILAGE CONDITIONS ===
+# frozenset is a set that can't be changed. Building it once here means
+# simulate_spoilage doesn't create a new list on every call.
+_HOT_MONTHS = frozenset({7, 8})  # July and August
+
+# One random number generator for all spoilage rolls
+_rng = random.Random()
+
+# random.binomialvariate (Python 3.12+) counts successes in many yes/no trials
+# with a single call. getattr() returns None on older Pythons that don't have it.
+_binomialvariate = getattr(_rng, "binomialvariate", None)
+
+
+def _count_spoiled(food_amount, chance):
+    """
+    Count how many of food_amount units spoil when each has the same chance
+    
+    This is the only place spoilage randomness happens, so a faster method
+    (or one that tracks freshness per unit) can be swapped in here without
+    touching the Inventory class.
+    
+    Args:
+        food_amount: Number of food units to check (integer)
+        chance: Probability that any one unit spoils (0.0 to 1.0)
+        
+    Returns:
+        int: Number of units that spoiled
+    """
+    if _binomialvariate is not None:
+        # Each unit spoiling is an independent yes/no trial with the same chance,
+        # so the total is a binomial draw - one call instead of one roll per unit
+        return _binomialvariate(food_amount, chance)
+
+    # Older Python: roll for every unit ourselves, two units per random draw.
+    # A unit spoils when its 32-bit random number is below threshold, which
+    # happens with probability threshold / 2**32 - the same as chance.
+    # One 64-bit draw holds two 32-bit numbers (the low half and the high half),
+    # so this needs half as many calls as rolling _rng.random() per unit.
+    threshold = int(chance * (1 << 32))
+    getrandbits = _rng.getrandbits  # Local name - looked up once, not every loop
+    spoiled_count = 0
+    # food_amount >> 1 is food_amount // 2 - the number of full pairs
+    # The _ variable means we don't actually use the loop variable
+    for _ in range(food_amount >> 1):
+        bits = getrandbits(64)
+        # True counts as 1 and False as 0 when added
+        spoiled_count += ((bits & 0xFFFFFFFF) < threshold) + ((bits >> 32) < threshold)
+    # An odd amount leaves one unit without a partner
+    if food_amount & 1:
+        spoiled_count += getrandbits(32) < threshold
+    return spoiled_count
+
 
 class Inventory:
     """
@@ -17,17 +75,37 @@ class Inventory:
     and simulates realistic food spoilage based on weather conditions.
     """
     
-    def __init__(self):
+    def __init__(self, item_weights=None, verbose=False):
         """
         Initialize an empty inventory
         
         __init__ is called when creating a new Inventory object.
+        
+        Args:
+            item_weights: Dictionary mapping item names to their weights (optional).
+                          When given, the total weight is kept up to date as items
+                          are added and removed, so total_weight() is instant.
+            verbose: Log a message for every change (default: False).
+                     The interactive game turns this on; simulations leave it off
+                     so they don't spend time building messages nobody reads.
         """
         # Dictionary to store items and their quantities
         # Key = item name (string), Value = quantity (integer)
         # Example: {"Food": 50, "Ammunition": 100, "Medicine": 10}
         self.items = {}
 
+        # Whether to log messages about changes
+        self.verbose = verbose
+
+        # Weight table and running total weight (only tracked when item_weights is given)
+        self._item_weights = item_weights
+        self._total_weight = 0
+
+        # Remembered system month for simulate_spoilage, so datetime.now()
+        # is only called once per game day (see the day_index argument)
+        self._cached_month = None
+        self._cached_month_day = -1  # Game day the cached month belongs to (-1 = none yet)
+
     def add_item(self, item_name, quantity=1):
         """
         Add items to the inventory
@@ -36,16 +114,17 @@ class Inventory:
             item_name: Name of the item to add (string)
             quantity: How many to add (integer, default: 1)
         """
-        # Check if we already have this item
-        if item_name in self.items:
-            # Add to existing quantity using += (same as: self.items[item_name] = self.items[item_name] + quantity)
-            self.items[item_name] += quantity
-        else:
-            # Create new entry for this item
-            self.items[item_name] = quantity
+        # Add to the existing quantity, or start from 0 if this is a new item
+        # .get() returns 0 when the item isn't in the dictionary yet
+        self.items[item_name] = self.items.get(item_name, 0) + quantity
         
-        # Print confirmation message
-        print(f"Added {quantity} x {item_name}")
+        # Keep the running total weight up to date
+        if self._item_weights is not None:
+            self._total_weight += self._item_weights.get(item_name, 0) * quantity
+        
+        # Log confirmation message (only built when verbose is on)
+        if self.verbose:
+            _log.info("Added %s x %s", quantity, item_name)
 
     def remove_item(self, item_name, quantity=1):
         """
@@ -58,24 +137,51 @@ class Inventory:
         Returns:
             bool: True if removal was successful, False if not enough items
         """
-        # Check if we have the item AND enough quantity
-        # "and" means both conditions must be true
-        if item_name in self.items and self.items[item_name] >= quantity:
-            # Remove the requested quantity
-            self.items[item_name] -= quantity
-            
-            # If quantity reaches 0, remove the item completely from the dictionary
-            if self.items[item_name] == 0:
-                # del removes a key-value pair from a dictionary
-                del self.items[item_name]
-            
-            print(f"Removed {quantity} x {item_name}")
+        if self._take(item_name, quantity):
+            if self.verbose:
+                _log.info("Removed %s x %s", quantity, item_name)
             return True  # Success
         
         # Not enough items to remove
-        print(f"Failed to remove {quantity} x {item_name} (not enough in inventory)")
+        if self.verbose:
+            _log.warning("Failed to remove %s x %s (not enough in inventory)", quantity, item_name)
         return False  # Failure
 
+    def _take(self, item_name, quantity):
+        """
+        Remove items without logging anything
+        
+        The shared part of remove_item() and spoil_food(), so each of them can
+        log its own message (and only one) when there isn't enough.
+        
+        Args:
+            item_name: Name of the item to remove (string)
+            quantity: How many to remove (integer)
+            
+        Returns:
+            bool: True if removal was successful, False if not enough items
+        """
+        # Look up how many we have in one step (0 if we don't have the item)
+        current = self.items.get(item_name, 0)
+        
+        # Check if we have enough
+        if current < quantity:
+            return False
+        
+        remaining = current - quantity
+        if remaining:
+            # Store the reduced quantity
+            self.items[item_name] = remaining
+        else:
+            # If quantity reaches 0, remove the item completely from the dictionary
+            # del removes a key-value pair from a dictionary
+            del self.items[item_name]
+        
+        # Keep the running total weight up to date
+        if self._item_weights is not None:
+            self._total_weight -= self._item_weights.get(item_name, 0) * quantity
+        return True
+
     def check_item(self, item_name):
         """
         Check how many of an item we have
@@ -107,27 +213,58 @@ class Inventory:
             for item, quantity in self.items.items():
                 print(f"- {item}: {quantity}")
 
-    def total_weight(self, item_weights):
+    def total_weight(self, item_weights=None):
         """
         Calculate the total weight of all items in inventory
         
         Args:
             item_weights: Dictionary mapping item names to their weights
                          Example: {"Food": 2.5, "Ammunition": 0.1, "Medicine": 0.5}
+                         Can be left out if the inventory was created with item_weights.
             
         Returns:
             float: Total weight of all items
         """
-        total = 0  # Start with 0 weight
+        # Fast path: we've been keeping a running total with the same weight table
+        if self._item_weights is not None and (item_weights is None or item_weights is self._item_weights):
+            return self._total_weight
+
+        # No weights known at all - nothing has any weight
+        if item_weights is None:
+            return 0
+
+        return self._sum_weight(item_weights)
+
+    def _sum_weight(self, item_weights):
+        """
+        Add up the weight of every item, ignoring the running total
         
-        # Loop through each item in our inventory
-        for item, qty in self.items.items():
-            # Look up the weight of this item (default to 0 if not found)
-            weight = item_weights.get(item, 0)
-            # Add (weight per item × quantity) to the total
-            total += weight * qty
+        Args:
+            item_weights: Dictionary mapping item names to their weights
+            
+        Returns:
+            float: Total weight of all items
+        """
+        # Save the .get method in a local name so the loop doesn't look it up every time
+        get_weight = item_weights.get
+        
+        # Add up (weight per item × quantity) for every item in one sum() call
+        # Items with no known weight count as 0
+        return sum(get_weight(item, 0) * qty for item, qty in self.items.items())
+
+    def recompute_weight(self):
+        """
+        Rebuild the running total weight from scratch
+        
+        Only needed if self.items was changed directly instead of through
+        add_item()/remove_item().
         
-        return total
+        Returns:
+            float: The recomputed total weight
+        """
+        # Sum directly - total_weight() would just hand back the stale running total
+        self._total_weight = self._sum_weight(self._item_weights or {})
+        return self._total_weight
 
     def spoil_food(self, quantity=1):
         """
@@ -138,17 +275,21 @@ class Inventory:
         Args:
             quantity: How many units of food to spoil (default: 1)
         """
-        # Check if we have enough food to spoil
-        if self.check_item("Food") >= quantity:
-            # Remove fresh food
-            self.remove_item("Food", quantity)
+        # Remove fresh food - _take() returns False if there isn't enough.
+        # It logs nothing, so a shortage only logs the warning below
+        # (not remove_item's general "Failed to remove" warning as well)
+        if self._take("Food", quantity):
+            if self.verbose:
+                _log.info("Removed %s x %s", quantity, "Food")
             # Add spoiled food (same quantity)
             self.add_item("Spoiled Food", quantity)
-            print(f"⚠️ {quantity} units of food have spoiled.")
+            if self.verbose:
+                _log.info("⚠️ %s units of food have spoiled.", quantity)
         else:
-            print("⚠️ Not enough Food in inventory to spoil.")
+            if self.verbose:
+                _log.warning("⚠️ Not enough Food in inventory to spoil.")
 
-    def simulate_spoilage(self, weather="clear", current_month=None):
+    def simulate_spoilage(self, weather=Weather.CLEAR, current_month=None, day_index=None):
         """
         Randomly spoil food based on weather and month conditions
         
@@ -156,42 +297,52 @@ class Inventory:
         and summer months increase spoilage rates.
         
         Args:
-            weather: Current weather condition (string, default: "clear")
+            weather: Current weather (Weather value or text like "rain", default: clear)
             current_month: Current month (1-12, default: current system month)
+            day_index: Current game day (optional). When given without current_month,
+                       the system month is looked up once per day and reused.
             
         Returns:
             int: Number of food units that spoiled
         """
+        # Get current food amount first - with no food there's nothing to spoil,
+        # so skip the month lookup and random rolls entirely
+        food_amount = self.check_item("Food")
+        if food_amount <= 0:
+            if self.verbose:
+                _log.info("✅ No food spoiled this time.")
+            return 0
+        
         # === SPOILAGE RATES ===
         base_chance = 0.03    # 3% chance per food unit under normal conditions
         boosted_chance = 0.08 # 8% chance per food unit under harsh conditions
         
         # If no month is specified, use the current system month
         # datetime.now().month gets the current month (1-12)
-        month = current_month if current_month else datetime.now().month
+        if current_month:
+            month = current_month
+        elif day_index is not None and day_index == self._cached_month_day:
+            # Already looked up today - reuse it instead of asking the clock again
+            month = self._cached_month
+        else:
+            month = datetime.now().month
+            if day_index is not None:
+                # Remember it for the rest of this game day
+                self._cached_month = month
+                self._cached_month_day = day_index
 
         # === DETERMINE SPOILAGE CHANCE ===
         # Check for conditions that increase spoilage
-        # .lower() converts string to lowercase for consistent comparison
-        # "in [7, 8]" checks if month is July (7) or August (8) - hot summer months
-        if weather.lower() == "rain" or month in [7, 8]:
+        # parse_weather turns text into a Weather value, so this is a number compare
+        # "in _HOT_MONTHS" checks if month is July (7) or August (8) - hot summer months
+        if parse_weather(weather) == Weather.RAIN or month in _HOT_MONTHS:
             chance = boosted_chance  # Use higher spoilage rate
         else:
             chance = base_chance     # Use normal spoilage rate
 
         # === SIMULATE SPOILAGE ===
-        # Get current food amount
-        food_amount = self.check_item("Food")
-        spoiled_count = 0  # Counter for how much food spoils
-
-        # Check each unit of food individually for spoilage
-        # range(food_amount) creates a sequence: 0, 1, 2, ..., food_amount-1
-        # The _ variable means we don't actually use the loop variable
-        for _ in range(food_amount):
-            # random.random() gives a number between 0.0 and 1.0
-            # If it's less than our spoilage chance, this unit spoils
-            if random.random() < chance:
-                spoiled_count += 1
+        # Count how much food spoils (nothing can spoil if the chance is 0)
+        spoiled_count = _count_spoiled(food_amount, chance) if chance > 0 else 0
 
         # === APPLY SPOILAGE ===
         if spoiled_count > 0:
@@ -199,7 +350,8 @@ class Inventory:
             self.spoil_food(spoiled_count)
         else:
             # No spoilage occurred
-            print("✅ No food spoiled this time.")
+            if self.verbose:
+                _log.info("✅ No food spoiled this time.")
 
         # Return how much spoiled for other systems to use
         return spoiled_count
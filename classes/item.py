@@ -6,24 +6,72 @@ Each item has properties like weight, whether it can spoil, etc.
 """
 
 # Import statements - bring in code from other modules
-import json  # For reading JSON files
-import os    # For file path operations
-
-# === LOAD ITEM DATA ===
-# Build the path to the items.json file
-# This follows the same pattern as person.py - go up one directory, then into data/
-DATA_PATH = os.path.join(os.path.dirname(__file__), '..', 'data', 'items.json')
-
-# Try to load the items file
-try:
-    # Open and read the JSON file
-    with open(DATA_PATH, 'r') as f:
-        # json.load() converts JSON data to a Python dictionary
-        ITEM_TYPES = json.load(f)
-except FileNotFoundError:
-    # If file doesn't exist, print warning and use empty dictionary
-    print("Warning: items.json not found. Defaulting to empty item type list.")
-    ITEM_TYPES = {}  # Empty dictionary
+import functools  # For lru_cache (remembers results of function calls)
+import os  # For building the data file path
+
+from classes._data import DATA_DIR, get_data  # Shared loader for the data/ folder
+
+# Path to the data file (read by _data.py together with the other data files)
+DATA_PATH = os.path.join(DATA_DIR, 'items.json')
+
+# === ITEM DATA (LOADED ON FIRST USE) ===
+# Both start empty (None) and are filled in by _load_item_types() the first
+# time an item is needed, so just importing this module doesn't read the file.
+_ITEM_TYPES = None   # Raw item data from items.json
+_ITEM_TABLE = None   # Pre-built property tuples, see below
+
+
+def _load_item_types():
+    """
+    Load items.json and build the item table (only the first call does any work)
+    
+    _ITEM_TABLE fills in the defaults for every item type once, so creating an
+    Item is a single dictionary lookup instead of six .get() calls.
+    Each value is a tuple in this order:
+    (weight, description, can_spoil, wears_out, usable, consumable, spoiled)
+    
+    Returns:
+        dict: The item table
+    """
+    # "global" lets this function replace the module-level variables
+    global _ITEM_TYPES, _ITEM_TABLE
+    if _ITEM_TABLE is not None:
+        return _ITEM_TABLE
+
+    # Get the parsed items file (see _data.py)
+    _ITEM_TYPES = get_data("items")
+    if _ITEM_TYPES is None:
+        # If file doesn't exist, print warning and use empty dictionary
+        print("Warning: items.json not found or unreadable. Defaulting to empty item type list.")
+        _ITEM_TYPES = {}  # Empty dictionary
+
+    _ITEM_TABLE = {
+        name: (
+            props.get("weight", 0),             # How much it weighs (default: 0)
+            props.get("description", ""),       # Description text (default: empty)
+            props.get("can_spoil", False),      # Can this item go bad? (default: False)
+            props.get("wears_out", False),      # Does this item wear out with use? (default: False)
+            props.get("usable", False),         # Can this item be used/activated? (default: False)
+            props.get("consumable", False),     # Is this item consumed when used? (default: False)
+            props.get("spoiled", False),        # Is this item currently spoiled? (default: False)
+        )
+        for name, props in _ITEM_TYPES.items()
+    }
+    return _ITEM_TABLE
+
+
+def __getattr__(name):
+    """
+    Load ITEM_TYPES the first time someone asks for it
+    
+    Python calls a module-level __getattr__ when code reads a name the module
+    doesn't have yet, so "from item import ITEM_TYPES" keeps working.
+    """
+    if name == "ITEM_TYPES":
+        _load_item_types()
+        return _ITEM_TYPES
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 class Item:
     """
@@ -31,40 +79,140 @@ class Item:
     
     Items are defined in the items.json file and have properties like
     weight, whether they can spoil, if they're consumable, etc.
+    
+    Items are read-only: once made, their properties can't be changed, which
+    also lets them be compared and hashed - so an Item can be used as a
+    dictionary key or put in a set.
+    
+    Item("Food") (like Item.from_name("Food") or get_item("Food")) gives the
+    shared item for that type. Passing every property, as from_name() does,
+    builds a new item.
     """
     
-    def __init__(self, name):
+    # Fixed list of attributes - no per-item dictionary, so items use less memory.
+    # The order matches the property tuples in _ITEM_TABLE (after the name).
+    __slots__ = (
+        "name",          # Item type name, e.g. "Food"
+        "weight",        # How much one unit weighs (lbs)
+        "description",   # Description text
+        "can_spoil",     # Can this item go bad?
+        "wears_out",     # Does this item wear out with use?
+        "usable",        # Can this item be used/activated?
+        "consumable",    # Is this item consumed when used?
+        "spoiled",       # Is this item currently spoiled?
+    )
+    
+    def __new__(cls, name, *props):
+        """
+        Hand back the shared item when only a name is given
+        
+        __new__ runs before __init__ and decides which object is returned.
+        """
+        if not props:
+            # Item("Food") - look up the item type (raises ValueError if unknown)
+            return cls.from_name(name)
+        return super().__new__(cls)
+    
+    def __init__(self, name, *props):
+        """
+        Create an item
+        
+        Args:
+            name: The name of the item type
+            *props: weight, description, can_spoil, wears_out, usable,
+                    consumable, spoiled - or nothing, to get the shared item
+                    for that name from items.json
+        """
+        if not props:
+            # __new__ returned the shared item, which is already set up
+            return
+        if len(props) != len(self.__slots__) - 1:
+            raise TypeError(f"Item() takes a name and {len(self.__slots__) - 1} properties, "
+                            f"got {len(props)} properties")
+        # object.__setattr__ skips our own __setattr__ below, which blocks changes
+        for field, value in zip(self.__slots__, (name, *props)):
+            object.__setattr__(self, field, value)
+    
+    def _values(self):
+        """All of the item's properties as a tuple, in __slots__ order"""
+        return tuple(getattr(self, field) for field in self.__slots__)
+    
+    def __setattr__(self, field, value):
+        """Items are read-only - changing a property is an error"""
+        raise AttributeError(f"cannot change '{field}': Item objects are read-only")
+    
+    def __delattr__(self, field):
+        """Items are read-only - deleting a property is an error"""
+        raise AttributeError(f"cannot delete '{field}': Item objects are read-only")
+    
+    def __eq__(self, other):
+        """Two items are equal when all of their properties match"""
+        # Items of a type are usually the one shared object, so "is" settles
+        # almost every comparison without looking at any properties
+        if self is other:
+            return True
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        # Different names can't match - only compare everything when they're the same
+        return self.name == other.name and self._values() == other._values()
+    
+    def __hash__(self):
+        """
+        Hash of the name only
+        
+        Equal items always have the same name, so this is a valid hash, and
+        hashing one short string is much cheaper than hashing every property.
+        """
+        return hash(self.name)
+    
+    def __repr__(self):
+        """Developer-friendly text, e.g. Item(name='Food', weight=1, ...)"""
+        fields = ", ".join(f"{field}={value!r}" for field, value in zip(self.__slots__, self._values()))
+        return f"{self.__class__.__name__}({fields})"
+    
+    def __reduce__(self):
+        """
+        Tell pickle and copy how to rebuild this item
+        
+        They'd normally set each slot one by one, which read-only items don't
+        allow. An item that matches its items.json entry is rebuilt with
+        from_name(), so copies and unpickled items are the shared object again.
+        Any other item is rebuilt with Item(name, *properties).
+        """
+        values = self._values()
+        # values[1:] skips the name - the rest lines up with the _ITEM_TABLE tuple
+        if _load_item_types().get(self.name) == values[1:]:
+            return (self.__class__.from_name, (self.name,))
+        return (self.__class__, values)
+    
+    @classmethod
+    @functools.lru_cache(maxsize=None)
+    def from_name(cls, name):
         """
-        Create a new item based on its name
+        Get the shared Item for an item type
+        
+        @functools.lru_cache remembers the item built for each name and hands
+        back that same object on later calls, so every "Food" is one object.
         
         Args:
             name: The name of the item type (must exist in items.json)
             
+        Returns:
+            Item: The shared item for that type
+            
         Raises:
             ValueError: If the item type is not defined in items.json
         """
-        # Check if this item type exists in our loaded data
-        if name in ITEM_TYPES:
-            # Get the properties for this item type
-            props = ITEM_TYPES[name]
-            
-            # === BASIC PROPERTIES ===
-            self.name = name
-            # .get() safely gets a value from dictionary, with default if key missing
-            self.weight = props.get("weight", 0)              # How much it weighs (default: 0)
-            self.description = props.get("description", "")   # Description text (default: empty)
-            
-            # === BEHAVIOR FLAGS ===
-            # These are boolean (True/False) properties that control how the item behaves
-            self.can_spoil = props.get("can_spoil", False)     # Can this item go bad? (default: False)
-            self.wears_out = props.get("wears_out", False)     # Does this item wear out with use? (default: False)
-            self.usable = props.get("usable", False)           # Can this item be used/activated? (default: False)
-            self.consumable = props.get("consumable", False)   # Is this item consumed when used? (default: False)
-            self.spoiled = props.get("spoiled", False)         # Is this item currently spoiled? (default: False)
-        else:
+        # Look up this item type's pre-built properties (None if it doesn't exist)
+        # (The first item ever requested triggers loading items.json)
+        props = _load_item_types().get(name)
+        if props is None:
             # Item type not found - raise an error
             # ValueError is a type of exception (error) that indicates invalid input
             raise ValueError(f"Item type '{name}' is not defined.")
+        
+        # *props unpacks the tuple into the remaining fields - the order matches _ITEM_TABLE above
+        return cls(name, *props)
 
     def __str__(self):
         """
@@ -77,3 +225,26 @@ class Item:
         """
         # Return a formatted string with name, description, and weight
         return f"{self.name}: {self.description} (Weight: {self.weight} lbs)"
+
+
+# === SHARED ITEM INSTANCES ===
+# Every item of a type has identical properties, so there's no need to build
+# a new object each time - Item.from_name() hands out one shared object per type.
+def get_item(name):
+    """
+    Get the shared Item object for an item type
+    
+    The same object is returned every time for the same name. Items are
+    frozen (read-only), so anything that changes per stack (like how much
+    of it has spoiled) belongs in the Inventory, not on the Item.
+    
+    Args:
+        name: The name of the item type (must exist in items.json)
+        
+    Returns:
+        Item: The shared item for that type
+        
+    Raises:
+        ValueError: If the item type is not defined in items.json
+    """
+    return Item.from_name(name)
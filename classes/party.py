@@ -8,8 +8,11 @@ This module handles party management, including:
 - Party-wide resource distribution
 """
 
-from typing import List, Dict, Tuple
+import heapq
+from typing import List, Dict, Tuple, Union
+from classes.health import weather_exposure_damage
 from classes.person import Person
+from classes.weather import Weather, parse_weather
 
 
 class Party:
@@ -17,6 +20,17 @@ class Party:
     Manages a group of travelers on the Oregon Trail
     """
     
+    # Fixed list of attributes - no per-party dictionary, so the many parties
+    # built by batch simulations (see party_sim.py) take less memory
+    __slots__ = (
+        "members",
+        "leader",
+        "days_traveled",
+        "total_deaths",
+        "food_reserves",
+        "medicine_supplies",
+    )
+    
     def __init__(self, leader_name: str = "Player", leader_age: int = 30, leader_profession: str = "Farmer"):
         """
         Initialize party with a leader
@@ -56,10 +70,14 @@ class Party:
     
     def remove_member(self, person: Person):
         """Remove a member from the party (typically due to death)"""
-        if person in self.members:
+        # list.remove() already searches for the person, so just try it and
+        # handle "not found" instead of searching twice with "in" first
+        try:
             self.members.remove(person)
-            if not person.is_alive():
-                self.total_deaths += 1
+        except ValueError:
+            return  # Not in this party
+        if not person.is_alive():
+            self.total_deaths += 1
     
     def get_living_members(self) -> List[Person]:
         """Get all living party members"""
@@ -80,33 +98,38 @@ class Party:
         Returns:
             Dictionary with party statistics and member status
         """
-        living = self.get_living_members()
-        dead = self.get_dead_members()
-        
-        # Calculate average health of living members
-        avg_health = 0
-        if living:
-            total_health = sum(member.health for member in living)
-            avg_health = total_health / len(living)
-        
-        # Get worst health status
+        # One pass over the members collects everything we need:
+        # how many are alive/dead, their total health, and who is worst off
+        living_count = 0
+        dead_count = 0
+        total_health = 0
         worst_health = 100
         worst_member = None
-        for member in living:
-            if member.health < worst_health:
-                worst_health = member.health
-                worst_member = member
+        for member in self.members:
+            if member.is_alive():
+                health = member.health
+                living_count += 1
+                total_health += health
+                # Track the lowest health seen so far
+                if health < worst_health:
+                    worst_health = health
+                    worst_member = member
+            else:
+                dead_count += 1
+        
+        # Calculate average health of living members
+        avg_health = total_health / living_count if living_count else 0
         
         return {
             "total_members": len(self.members),
-            "living_members": len(living),
-            "dead_members": len(dead),
+            "living_members": living_count,
+            "dead_members": dead_count,
             "average_health": round(avg_health, 1),
             "worst_health": worst_health,
             "worst_member": worst_member.name if worst_member else None,
             "days_traveled": self.days_traveled,
             "total_deaths": self.total_deaths,
-            "game_over": self.is_game_over()
+            "game_over": living_count == 0
         }
     
     def distribute_food(self, total_food_available: float, rationing_level: float = 1.0) -> Dict:
@@ -120,7 +143,11 @@ class Party:
         Returns:
             Dictionary showing food distribution results
         """
-        living_members = self.get_living_members()
+        return self._distribute_food(self.get_living_members(), total_food_available, rationing_level)
+    
+    def _distribute_food(self, living_members: List[Person], total_food_available: float,
+                         rationing_level: float) -> Dict:
+        """Feed the given living members (see distribute_food)"""
         if not living_members:
             return {"success": False, "reason": "No living members"}
         
@@ -128,13 +155,23 @@ class Party:
         daily_requirement = 2.0  # pounds per person per day
         total_needed = len(living_members) * daily_requirement * rationing_level
         
-        # Distribute food
-        if total_food_available >= total_needed:
+        # Work out each person's share first...
+        has_enough = total_food_available >= total_needed
+        if has_enough:
             # Enough food for everyone
             food_per_person = daily_requirement * rationing_level
-            for member in living_members:
-                member.daily_update(food_consumed=food_per_person)
-            
+        elif total_food_available > 0:
+            # Not enough food - distribute equally
+            food_per_person = total_food_available / len(living_members)
+        else:
+            # No food at all
+            food_per_person = 0
+        
+        # ...then feed everyone in a single pass
+        for member in living_members:
+            member.daily_update(food_consumed=food_per_person)
+        
+        if has_enough:
             return {
                 "success": True,
                 "food_used": total_needed,
@@ -142,37 +179,41 @@ class Party:
                 "rations": "Full" if rationing_level >= 1.0 else "Reduced",
                 "members_fed": len(living_members)
             }
-        else:
-            # Not enough food - distribute equally
-            if total_food_available > 0:
-                food_per_person = total_food_available / len(living_members)
-                for member in living_members:
-                    member.daily_update(food_consumed=food_per_person)
-            else:
-                # No food at all
-                for member in living_members:
-                    member.daily_update(food_consumed=0)
-            
-            return {
-                "success": False,
-                "food_used": total_food_available,
-                "food_remaining": 0,
-                "rations": "Starvation",
-                "members_fed": len(living_members),
-                "food_per_person": total_food_available / len(living_members) if living_members else 0
-            }
+        
+        return {
+            "success": False,
+            "food_used": total_food_available,
+            "food_remaining": 0,
+            "rations": "Starvation",
+            "members_fed": len(living_members),
+            "food_per_person": total_food_available / len(living_members) if living_members else 0
+        }
     
-    def apply_weather_to_party(self, weather: str, shelter_quality: float = 1.0):
+    def apply_weather_to_party(self, weather: Union[Weather, str], shelter_quality: float = 1.0):
         """
         Apply weather effects to all living party members
         
         Args:
-            weather: Weather type (hot, cold, rain, snow, storm)
+            weather: Weather value or text (hot, cold, rain, snow, storm)
             shelter_quality: Quality of shelter (0.0 = no protection, 1.0 = full protection)
         """
-        living_members = self.get_living_members()
+        self._apply_weather(self.get_living_members(), parse_weather(weather), shelter_quality)
+    
+    def _apply_weather(self, living_members: List[Person], weather: Weather, shelter_quality: float):
+        """Apply weather to the given members (see apply_weather_to_party)"""
+        # Everyone shares the same weather and shelter, so work out the damage once
+        exposure_damage = weather_exposure_damage(weather, shelter_quality)
+        
+        # Full shelter (or harmless weather) means nobody takes damage today
+        if exposure_damage <= 0:
+            return
+        
         for member in living_members:
-            member.apply_weather_exposure(weather, shelter_quality)
+            health_system = member.health_system
+            # The list may have been made earlier in the day, so skip anyone who has died since
+            if not health_system.is_alive:
+                continue
+            health_system.apply_exposure_damage(exposure_damage, weather)
     
     def treat_sick_members(self, medicine_available: int) -> Dict:
         """
@@ -184,27 +225,30 @@ class Party:
         Returns:
             Dictionary showing treatment results
         """
-        living_members = self.get_living_members()
+        return self._treat(self.get_living_members(), medicine_available)
+    
+    def _treat(self, living_members: List[Person], medicine_available: int) -> Dict:
+        """Treat the sickest of the given members (see treat_sick_members)"""
         sick_members = []
         
         # Find members who need treatment (health < 50 or have conditions)
+        # (skipping anyone who has died since the list was made)
         for member in living_members:
-            if member.health < 50 or len(member.health_system.conditions) > 1:
+            if not member.is_alive():
+                continue
+            if member.health < 50 or member.health_system.condition_count() > 1:
                 sick_members.append(member)
         
-        # Sort by health (worst first)
-        sick_members.sort(key=lambda m: m.health)
+        # Pick the worst-off members we have medicine for
+        # heapq.nsmallest finds the N lowest without sorting the whole list
+        # (it gives the same result as sorting by health and taking the first N)
+        to_treat = heapq.nsmallest(medicine_available, sick_members, key=lambda m: m.health)
         
-        treatments_given = 0
         treated_members = []
-        
-        for member in sick_members:
-            if treatments_given < medicine_available:
-                member.apply_medicine("General Medicine", effectiveness=0.8)
-                treated_members.append(member.name)
-                treatments_given += 1
-            else:
-                break
+        for member in to_treat:
+            member.apply_medicine("General Medicine", effectiveness=0.8)
+            treated_members.append(member.name)
+        treatments_given = len(treated_members)
         
         return {
             "medicine_used": treatments_given,
@@ -219,7 +263,7 @@ class Party:
                           rationing_level: float = 1.0,
                           rest_hours: int = 8,
                           rest_quality: float = 1.0,
-                          weather: str = "fair",
+                          weather: Union[Weather, str] = Weather.CLEAR,
                           shelter_quality: float = 1.0,
                           medicine_used: int = 0) -> Dict:
         """
@@ -230,7 +274,7 @@ class Party:
             rationing_level: Food rationing level
             rest_hours: Hours of rest for the day
             rest_quality: Quality of rest
-            weather: Weather conditions
+            weather: Weather conditions (a Weather value, or text like "rain")
             shelter_quality: Quality of shelter
             medicine_used: Medicine units used
             
@@ -239,30 +283,33 @@ class Party:
         """
         self.days_traveled += 1
         
+        # Find the living members once and share the list with every step below
+        # (each step skips anyone who dies partway through the day)
+        living_members = self.get_living_members()
+        
         # Distribute food
-        food_result = self.distribute_food(food_available, rationing_level)
+        food_result = self._distribute_food(living_members, food_available, rationing_level)
         
         # Apply weather effects
-        self.apply_weather_to_party(weather, shelter_quality)
+        # (text weather is converted once here, so nothing below compares strings)
+        self._apply_weather(living_members, parse_weather(weather), shelter_quality)
         
         # Apply rest to all members (already done in food distribution for living members)
-        living_members = self.get_living_members()
         for member in living_members:
+            # Look up the member's health system once and reuse it for the whole tick
+            health_system = member.health_system
+            if not health_system.is_alive:
+                continue
             # Update rest separately since food distribution only handles food
-            member.health_system.get_rest(rest_hours, rest_quality)
-            member.health_system.daily_health_update()
-            member.health = member.health_system.current_health
-            member.status = "Dead" if not member.health_system.is_alive else "Alive"
+            health_system.get_rest(rest_hours, rest_quality)
+            health_system.daily_health_update()
         
         # Treat sick members
-        treatment_result = self.treat_sick_members(medicine_used)
+        treatment_result = self._treat(living_members, medicine_used)
         
-        # Remove dead members
-        dead_today = []
-        for member in self.members[:]:  # Copy list to avoid modification during iteration
-            if not member.is_alive() and member.status == "Alive":
-                dead_today.append(member.name)
-                member.status = "Dead"
+        # Record anyone who died today: everyone in living_members was alive
+        # when the day started, so any of them not alive now died today
+        dead_today = [member.name for member in living_members if not member.is_alive()]
         
         # Compile daily report
         party_status = self.get_party_status()
@@ -274,7 +321,7 @@ class Party:
             "deaths_today": dead_today,
             "party_status": party_status,
             "weather": weather,
-            "game_over": self.is_game_over()
+            "game_over": party_status["game_over"]
         }
     
     def get_detailed_party_report(self) -> str:
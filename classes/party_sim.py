@@ -0,0 +1,72 @@
+"""
+party_sim.py - Runs many parties through the same conditions to estimate survival odds
+
+This module answers "how many of my party would survive N days of this?"
+by simulating lots of independent copies (replicas) of the same party and
+counting survivors in each one. The regular Party class is used for every
+replica, so the results always follow the real game rules.
+"""
+
+from collections import Counter
+from typing import Dict, List, Sequence, Tuple
+from classes.party import Party
+
+
+def simulate_batch(n_replicas: int,
+                   days: int,
+                   members: Sequence[Tuple[str, int, str]],
+                   **daily_conditions) -> List[int]:
+    """
+    Simulate many copies of a party and count survivors in each
+
+    Args:
+        n_replicas: How many independent parties to simulate
+        days: How many days each party travels
+        members: (name, age, profession) for each member - the first one leads
+        **daily_conditions: Passed to Party.daily_party_update every day
+                            (food_available, rationing_level, weather, etc.)
+
+    Returns:
+        List with the number of living members at the end of each replica
+    """
+    if not members:
+        raise ValueError("A party needs at least one member.")
+
+    leader, *others = members
+    survivors = []
+
+    for _ in range(n_replicas):
+        # Build a fresh party for this replica
+        party = Party(*leader)
+        for name, age, profession in others:
+            party.add_member(name, age, profession)
+
+        # Travel day by day, stopping early if everyone has died
+        for _ in range(days):
+            report = party.daily_party_update(**daily_conditions)
+            if report["game_over"]:
+                break
+
+        survivors.append(len(party.get_living_members()))
+
+    return survivors
+
+
+def survival_distribution(survivors: Sequence[int]) -> Dict[int, float]:
+    """
+    Turn survivor counts into the fraction of replicas ending with each count
+
+    Args:
+        survivors: Result of simulate_batch()
+
+    Returns:
+        Dictionary mapping number of survivors to fraction of replicas (0.0 to 1.0)
+        Example: {0: 0.25, 2: 0.75}
+    """
+    if not survivors:
+        return {}
+
+    # Counter counts how many times each survivor count appears
+    counts = Counter(survivors)
+    total = len(survivors)
+    return {alive: count / total for alive, count in sorted(counts.items())}
@@ -6,30 +6,113 @@ profession, health system, and daily updates.
 """
 
 # Import statements - these bring in code from other files
-import json  # For reading JSON files
-import os    # For file path operations
+import copy  # For copying the starting Health of each profession
+import os  # For building the data file path
+import sys  # For sys.intern (shares one copy of repeated strings)
+from typing import NamedTuple, Tuple  # For the profession table's rows
+
+from classes._data import DATA_DIR, get_data  # Shared loader for the data/ folder
 from classes.health import Health, HealthStatus  # Our custom health system
 
-# === LOAD PROFESSIONS DATA ===
-# Build the path to the professions.json file
-# __file__ is the current file (person.py)
-# os.path.dirname() gets the directory containing this file (classes/)
-# '..' means go up one directory level (to the main project folder)
-# Then we go into the 'data' folder and get 'professions.json'
-DATA_PATH = os.path.join(os.path.dirname(__file__), '..', 'data', 'professions.json')
-
-# Try to load the professions file
-try:
-    # 'with open()' safely opens and automatically closes files
-    # 'r' means read mode (we're only reading, not writing)
-    # 'as f' creates a variable called 'f' that represents the file
-    with open(DATA_PATH, 'r') as f:
-        # json.load() reads the JSON file and converts it to a Python dictionary
-        PROFESSIONS = json.load(f)
-except FileNotFoundError:
-    # If the file doesn't exist, print a warning and use an empty dictionary
-    print("Warning: professions.json not found. Defaulting to empty profession list.")
-    PROFESSIONS = {}  # Empty dictionary
+# Path to the data file (read by _data.py together with the other data files)
+DATA_PATH = os.path.join(DATA_DIR, 'professions.json')
+
+
+def _load_professions():
+    """
+    Get the parsed contents of professions.json
+    
+    The file is read by _data.py, together with the other data files,
+    the first time any of them is needed.
+    
+    Returns:
+        dict: Profession name -> profession data
+    """
+    data = get_data("professions")
+    if data is None:
+        # If the file doesn't exist, print a warning and use an empty dictionary
+        print("Warning: professions.json not found or unreadable. Defaulting to empty profession list.")
+        data = {}  # Empty dictionary
+    return data
+
+
+# === PROFESSION TABLE (BUILT ON FIRST USE) ===
+# Everything a Person needs from a profession, worked out once instead of
+# on every Person() or apply_profession_effects() call.
+class _ProfessionRow(NamedTuple):
+    """
+    One profession's entry in the profession table
+    
+    A NamedTuple is a tuple whose positions also have names, so code can
+    read row.health_template instead of remembering that it's row[3].
+    """
+    health_bonus: int
+    advantages: Tuple[str, ...]
+    disadvantages: Tuple[str, ...]
+    # A ready-made starting Health for the profession - new people get
+    # a copy of it instead of building their Health from scratch
+    health_template: Health
+
+
+# Both start empty and are filled in by _profession_table() the first time
+# a Person is created, so just importing this module doesn't read the file.
+_PROF_TABLE = None
+_DEFAULT_PROF = _ProfessionRow(0, (), (), Health())  # Unknown professions are treated as Farmers (see Person.__init__)
+
+# sys.intern keeps a single shared copy of a string. Profession names are
+# interned when the table is built, so every Person with the same profession
+# points at the same string and comparing them is a quick identity check.
+_FARMER = sys.intern("Farmer")
+
+
+def _profession_row(data):
+    """
+    Build one profession's table row from its professions.json entry
+    
+    Args:
+        data: The profession's dictionary from professions.json
+        
+    Returns:
+        _ProfessionRow: The profession's pre-built details
+    """
+    health_bonus = int(data.get("health_bonus", 0))     # Health bonus (default: 0)
+    return _ProfessionRow(
+        health_bonus,
+        tuple(data.get("advantages", ())),               # Advantage descriptions
+        tuple(data.get("disadvantages", ())),            # Disadvantage descriptions
+        Health(initial_health=100, constitution_bonus=health_bonus),  # Starting health
+    )
+
+
+def _profession_table():
+    """
+    Get the profession table, loading professions.json the first time
+    
+    Returns:
+        dict: Profession name -> _ProfessionRow
+    """
+    # "global" lets this function replace the module-level variables
+    global _PROF_TABLE, _DEFAULT_PROF
+    if _PROF_TABLE is None:
+        _PROF_TABLE = {
+            sys.intern(name): _profession_row(data)
+            for name, data in _load_professions().items()
+        }
+        _DEFAULT_PROF = _PROF_TABLE.get(_FARMER, _DEFAULT_PROF)
+    return _PROF_TABLE
+
+
+def __getattr__(name):
+    """
+    Load PROFESSIONS the first time someone asks for it
+    
+    Python calls a module-level __getattr__ when code reads a name the module
+    doesn't have, so "from person import PROFESSIONS" keeps working.
+    """
+    if name == "PROFESSIONS":
+        return _load_professions()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 class Person:
     """
@@ -39,6 +122,12 @@ class Person:
     They can be updated daily with food, rest, and other factors.
     """
     
+    # Fixed list of attributes - no per-person dictionary, so people use less memory
+    # and reading attributes like self.health_system is a little faster.
+    # Any new attribute set in __init__ must be added here too.
+    # (health and status are properties below, so they don't need slots)
+    __slots__ = ("name", "age", "profession", "health_system", "is_solo")
+    
     def __init__(self, name, age, profession):
         """
         Create a new person
@@ -52,26 +141,25 @@ class Person:
         self.name = name
         self.age = age
         
-        # Validate profession - if it's not in our PROFESSIONS list, default to "Farmer"
-        # "in PROFESSIONS" checks if the profession exists as a key in the dictionary
-        self.profession = profession if profession in PROFESSIONS else "Farmer"
-        
         # === GET PROFESSION-SPECIFIC HEALTH MODIFIERS ===
-        # Get the profession data from the PROFESSIONS dictionary
-        # .get() safely gets a value, returning {} (empty dict) if profession not found
-        profession_data = PROFESSIONS.get(self.profession, {})
+        # Look up the profession's pre-built row (None if it isn't a known profession)
+        # (The first Person ever created triggers loading professions.json)
+        profession_row = _profession_table().get(profession)
         
-        # Get the health bonus for this profession, defaulting to 0 if not specified
-        constitution_bonus = profession_data.get("health_bonus", 0)
+        # Validate profession - if it's not in our PROFESSIONS list, default to "Farmer"
+        if profession_row is None:
+            self.profession = _FARMER
+            profession_row = _DEFAULT_PROF
+        else:
+            # Store the shared copy of the name (see _FARMER above)
+            self.profession = sys.intern(profession)
         
         # === INITIALIZE HEALTH SYSTEM ===
-        # Create a new Health object with initial health and profession bonus
-        self.health_system = Health(initial_health=100, constitution_bonus=constitution_bonus)
-        
-        # === LEGACY COMPATIBILITY ===
-        # Keep a simple health property for backwards compatibility with older code
-        self.health = self.health_system.current_health
-        self.status = "Alive"  # Simple alive/dead status
+        # Every new person of a profession starts with the same health, so copy the
+        # profession's ready-made Health instead of building one from scratch.
+        # copy.copy() uses Health.__copy__, which gives the copy its own
+        # condition timers so people never share them.
+        self.health_system = copy.copy(profession_row.health_template)
 
         # === SPECIAL FLAGS ===
         # Check if this is a solo traveler (special profession with unique rules)
@@ -87,16 +175,15 @@ class Person:
         """
         print(f"Applying effects for profession: {self.profession}")
         
-        # Get the effects data for this profession
-        effects = PROFESSIONS.get(self.profession, {})
+        # Get the pre-built row for this profession
+        profession_row = _profession_table().get(self.profession, _DEFAULT_PROF)
         
-        # Print all advantages
-        # .get() returns an empty list [] if "advantages" key doesn't exist
-        for adv in effects.get("advantages", []):
+        # Print all the pre-built advantages for this profession
+        for adv in profession_row.advantages:
             print(f"Advantage: {adv}")
             
         # Print all disadvantages
-        for disadv in effects.get("disadvantages", []):
+        for disadv in profession_row.disadvantages:
             print(f"Disadvantage: {disadv}")
     
     def daily_update(self, food_consumed=0, rest_hours=8, rest_quality=1.0):
@@ -119,13 +206,20 @@ class Person:
         # === PROCESS HEALTH CHANGES ===
         # Let the health system calculate and apply all daily health changes
         self.health_system.daily_health_update()
-        
-        # === UPDATE LEGACY PROPERTIES ===
-        # Keep the simple properties in sync with the health system
-        self.health = self.health_system.current_health
-        
-        # Update status based on whether the person is still alive
-        self.status = "Dead" if not self.health_system.is_alive else "Alive"
+    
+    # === LEGACY COMPATIBILITY ===
+    # Older code reads person.health and person.status directly.
+    # @property makes them look like plain attributes, but each read asks the
+    # health system, so they can never go out of date.
+    @property
+    def health(self):
+        """Current health points (read from the health system)"""
+        return self.health_system.current_health
+    
+    @property
+    def status(self):
+        """Simple alive/dead status: "Alive" or "Dead" """
+        return "Alive" if self.health_system.is_alive else "Dead"
     
     def get_health_status(self):
         """
@@ -155,23 +249,17 @@ class Person:
         """
         # Use the health system to apply medicine
         self.health_system.apply_medicine(medicine_type, effectiveness)
-        
-        # Update the legacy health property to stay in sync
-        self.health = self.health_system.current_health
     
     def apply_weather_exposure(self, weather, protection=1.0):
         """
         Apply weather effects to this person
         
         Args:
-            weather: Weather type (hot, cold, rain, snow, storm, etc.)
+            weather: Weather value or text (hot, cold, rain, snow, storm, etc.)
             protection: Protection level (0.0 = no protection, 1.0 = full protection)
         """
         # Use the health system to apply weather effects
         self.health_system.apply_weather_exposure(weather, protection)
-        
-        # Update the legacy health property to stay in sync
-        self.health = self.health_system.current_health
 
     def __str__(self):
         """
@@ -186,6 +274,12 @@ class Person:
         # Get detailed health description from the health system
         health_desc = self.health_system.get_health_description()
         
-        # Return a formatted string with all the person's information
-        # f"..." is an f-string that lets us put variables into the text
-        return f"{self.name}, Age {self.age}, Profession: {self.profession}, Health: {health_desc}, Status: {self.status}"
+        # Return a string with all the person's information
+        # "".join() glues the pieces together in one step instead of building
+        # a new string for every +. Name, age and profession are read fresh
+        # each time, since any of them can be changed after the person is made.
+        # str(self.age) because join() only accepts strings
+        return "".join((
+            self.name, ", Age ", str(self.age), ", Profession: ", self.profession,
+            ", Health: ", health_desc, ", Status: ", self.status,
+        ))
@@ -6,24 +6,65 @@ Each wagon type has different capacities, costs, and breakdown chances.
 """
 
 # Import statements - bring in code from other modules
-import json  # For reading JSON files
-import os    # For file path operations
-
-# === LOAD WAGON DATA ===
-# Build the path to the wagons.json file
-# Same pattern as other classes - go up one directory, then into data/
-DATA_PATH = os.path.join(os.path.dirname(__file__), '..', 'data', 'wagons.json')
-
-# Try to load the wagons file
-try:
-    # Open and read the JSON file
-    with open(DATA_PATH, 'r') as f:
-        # json.load() converts JSON data to a Python dictionary
-        WAGON_TYPES = json.load(f)
-except FileNotFoundError:
-    # If file doesn't exist, print warning and use empty dictionary
-    print("Warning: wagons.json not found. Defaulting to empty wagon list.")
-    WAGON_TYPES = {}  # Empty dictionary
+import os  # For building the data file path
+import sys  # For sys.intern (shares one copy of repeated strings)
+
+from classes._data import DATA_DIR, get_data  # Shared loader for the data/ folder
+
+# Path to the data file (read by _data.py together with the other data files)
+DATA_PATH = os.path.join(DATA_DIR, 'wagons.json')
+
+# Wagon data, filled in the first time a Wagon is created (see _wagon_types),
+# so just importing this module doesn't read the file
+_WAGON_TYPES = None
+
+# Shared copy of the default wagon name (see _FARMER in person.py)
+_STANDARD = sys.intern("Standard")
+
+
+def _load_wagon_types():
+    """
+    Get the parsed contents of wagons.json
+    
+    Same approach as _load_professions() in person.py.
+    
+    Returns:
+        dict: Wagon type name -> wagon statistics
+    """
+    data = get_data("wagons")
+    if data is None:
+        # If file doesn't exist, print warning and use empty dictionary
+        print("Warning: wagons.json not found or unreadable. Defaulting to empty wagon list.")
+        data = {}  # Empty dictionary
+    return data
+
+
+def _wagon_types():
+    """
+    Get the wagon data, loading wagons.json the first time
+    
+    Returns:
+        dict: Wagon type name -> wagon statistics
+    """
+    # "global" lets this function replace the module-level variable
+    global _WAGON_TYPES
+    if _WAGON_TYPES is None:
+        # Intern the names so every Wagon of a type shares one name string
+        _WAGON_TYPES = {sys.intern(name): stats for name, stats in _load_wagon_types().items()}
+    return _WAGON_TYPES
+
+
+def __getattr__(name):
+    """
+    Load WAGON_TYPES the first time someone asks for it
+    
+    Works the same way as ITEM_TYPES in item.py, so "from wagon import WAGON_TYPES"
+    keeps working.
+    """
+    if name == "WAGON_TYPES":
+        return _wagon_types()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 class Wagon:
     """
@@ -33,6 +74,10 @@ class Wagon:
     and chances of breaking down during travel.
     """
     
+    # Fixed list of attributes - no per-wagon dictionary, so wagons use less memory
+    __slots__ = ("wagon_type", "cost", "capacity", "breakdown_chance", "repair_difficulty", "current_load",
+                 "_str_prefix", "_str_suffix")
+    
     def __init__(self, wagon_type):
         """
         Create a new wagon of the specified type
@@ -40,12 +85,15 @@ class Wagon:
         Args:
             wagon_type: Type of wagon (must exist in wagons.json, defaults to "Standard")
         """
+        # Get the wagon data (the first Wagon ever created triggers loading wagons.json)
+        wagon_types = _wagon_types()
+        
         # Validate wagon type - use "Standard" if the requested type doesn't exist
-        self.wagon_type = wagon_type if wagon_type in WAGON_TYPES else "Standard"
+        self.wagon_type = sys.intern(wagon_type) if wagon_type in wagon_types else _STANDARD
         
         # Get the statistics for this wagon type
         # .get() returns an empty dictionary {} if the wagon type isn't found
-        wagon_stats = WAGON_TYPES.get(self.wagon_type, {})
+        wagon_stats = wagon_types.get(self.wagon_type, {})
 
         # === WAGON PROPERTIES ===
         # Load properties from the wagon data, with sensible defaults
@@ -56,6 +104,17 @@ class Wagon:
         
         # === CURRENT STATE ===
         self.current_load = 0  # How much weight is currently loaded (starts at 0)
+        
+        # === DISPLAY TEXT ===
+        # Only current_load changes after the wagon is built, so the text around it
+        # is formatted once here and __str__ just glues the three pieces together.
+        # Multiply breakdown_chance by 100 to show as percentage
+        # :.1f shows one decimal place, so 0.2 shows as "20.0%" and never "20.000000000000004%"
+        self._str_prefix = f"{self.wagon_type} Wagon | Capacity: {self.capacity} lbs | Current Load: "
+        self._str_suffix = (
+            f" lbs | Breakdown Chance: {self.breakdown_chance * 100:.1f}% | "
+            f"Repair Difficulty: {self.repair_difficulty}"
+        )
 
     def can_add_cargo(self, weight):
         """
@@ -81,10 +140,12 @@ class Wagon:
         Returns:
             bool: True if cargo was added successfully, False if there wasn't room
         """
-        # First check if we can add this cargo
-        if self.can_add_cargo(weight):
-            # Add the weight to our current load
-            self.current_load += weight
+        # Work out the new load once, then check it against capacity
+        # (same test as can_add_cargo, without a second method call and addition)
+        new_load = self.current_load + weight
+        if new_load <= self.capacity:
+            # Store the new load
+            self.current_load = new_load
             return True  # Success
         
         # Not enough room
@@ -100,9 +161,5 @@ class Wagon:
             str: Formatted description of the wagon and its status
         """
         # Return a detailed string with all important wagon information
-        # Multiply breakdown_chance by 100 to show as percentage
-        return (
-            f"{self.wagon_type} Wagon | Capacity: {self.capacity} lbs | "
-            f"Current Load: {self.current_load} lbs | Breakdown Chance: {self.breakdown_chance * 100}% | "
-            f"Repair Difficulty: {self.repair_difficulty}"
-        )
+        # (the fixed parts were built in __init__)
+        return self._str_prefix + str(self.current_load) + self._str_suffix
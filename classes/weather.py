@@ -0,0 +1,67 @@
+"""
+weather.py - Weather types for the Oregon Trail fan build
+
+Weather used to be passed around as plain strings ("rain", "Cold", ...) and
+every system lowercased and compared them on its own. Now text is turned into
+a Weather value once, where it enters the game, and everything after that
+works with small whole numbers.
+"""
+
+from enum import IntEnum
+from types import MappingProxyType
+from typing import Union
+
+
+class Weather(IntEnum):
+    """
+    Kinds of weather a party can travel through
+
+    Like HealthCondition, each weather type is a plain integer underneath,
+    so it can be used directly as an index into a tuple of values
+    (see _WEATHER_DAMAGE in health.py).
+    """
+    CLEAR = 0    # Fair or unknown weather
+    RAIN = 1
+    HOT = 2
+    COLD = 3
+    SNOW = 4
+    STORM = 5
+
+    @property
+    def label(self) -> str:
+        """Lowercase display name, e.g. 'rain'"""
+        return _WEATHER_NAMES[self]
+
+
+# Display names, indexed by weather number
+_WEATHER_NAMES = ("clear", "rain", "hot", "cold", "snow", "storm")
+
+# Lowercase text -> Weather (read-only). "fair" is another name for clear weather.
+_WEATHER_BY_NAME = MappingProxyType({
+    **{name: Weather(code) for code, name in enumerate(_WEATHER_NAMES)},
+    "fair": Weather.CLEAR,
+})
+
+
+def parse_weather(weather: Union[Weather, str]) -> Weather:
+    """
+    Turn weather text into a Weather value
+
+    Call this once where weather comes into the game, then pass the
+    Weather value on instead of the text.
+
+    Args:
+        weather: A Weather value (returned as-is) or text like "rain" or "Storm"
+
+    Returns:
+        Weather: The matching weather (CLEAR if the text isn't recognized)
+    """
+    if isinstance(weather, Weather):
+        return weather
+    # Most text is already lowercase, so try it as-is first -
+    # that skips building a new lowercase string
+    code = _WEATHER_BY_NAME.get(weather)
+    if code is None:
+        # .lower() lets "Rain", "RAIN" and "rain" all match
+        code = _WEATHER_BY_NAME.get(weather.lower(), Weather.CLEAR)
+    return code
@@ -7,152 +7,175 @@ Demonstrates the new health system with multiple scenarios:
 - Weather exposure
 - Disease and medicine
 - Death mechanics
+- Survival odds from many simulated parties
 """
 
+import io
+import logging
 import sys
-import os
-
-# Add the classes directory to the path
-sys.path.append(os.path.join(os.path.dirname(__file__), 'classes'))
 
 # Import classes
 from classes.party import Party
+from classes.party_sim import simulate_batch, survival_distribution
 from classes.health import HealthCondition
+from classes.weather import Weather
+
+
+# === BUFFERED OUTPUT ===
+# Each print() to the terminal can mean a separate write to the operating system.
+# The demos instead collect their text in memory (a StringIO acts like a file
+# that lives in a string) and write it out in one go at the end of each demo.
+_buf = io.StringIO()
+
+
+def _print(*args, **kwargs):
+    """print() into the demo buffer instead of straight to the terminal"""
+    print(*args, file=_buf, **kwargs)
+
+
+def _flush():
+    """Write everything buffered so far to the terminal and empty the buffer"""
+    sys.stdout.write(_buf.getvalue())
+    sys.stdout.flush()
+    _buf.seek(0)      # Go back to the start of the buffer...
+    _buf.truncate(0)  # ...and throw away what was there
 
 
 def demo_basic_survival():
     """Demo basic daily survival with good conditions"""
-    print("=== BASIC SURVIVAL DEMO ===")
+    _print("=== BASIC SURVIVAL DEMO ===")
     party = Party("John", 35, "Farmer")
     party.add_member("Mary", 32, "Doctor")
     party.add_member("Tommy", 12, "Farmer")
     
-    print("Initial party status:")
-    print(party.get_detailed_party_report())
-    print()
+    _print("Initial party status:")
+    _print(party.get_detailed_party_report())
+    _print()
     
     # Simulate 5 days of good conditions
     for day in range(1, 6):
-        print(f"--- Day {day} ---")
+        _print(f"--- Day {day} ---")
         daily_report = party.daily_party_update(
             food_available=8.0,  # Plenty of food (4 pounds per person)
             rationing_level=1.0,
             rest_hours=8,
             rest_quality=1.0,
-            weather="fair",
+            weather=Weather.CLEAR,
             shelter_quality=1.0,
             medicine_used=0
         )
         
-        print(f"Food: {daily_report['food_distribution']['food_used']:.1f} lbs used")
-        print(f"Average Health: {daily_report['party_status']['average_health']}")
-        print()
+        _print(f"Food: {daily_report['food_distribution']['food_used']:.1f} lbs used")
+        _print(f"Average Health: {daily_report['party_status']['average_health']}")
+        _print()
     
-    print("Final status after good conditions:")
-    print(party.get_detailed_party_report())
-    print("\n" + "="*50 + "\n")
+    _print("Final status after good conditions:")
+    _print(party.get_detailed_party_report())
+    _print("\n" + "="*50 + "\n")
+    _flush()
 
 
 def demo_starvation():
     """Demo starvation effects"""
-    print("=== STARVATION DEMO ===")
+    _print("=== STARVATION DEMO ===")
     party = Party("Bob", 40, "Banker")
     party.add_member("Alice", 38, "Carpenter")
     
-    print("Starting starvation scenario...")
-    print(party.get_detailed_party_report())
-    print()
+    _print("Starting starvation scenario...")
+    _print(party.get_detailed_party_report())
+    _print()
     
     # Simulate 10 days of starvation
     for day in range(1, 11):
-        print(f"--- Day {day} ---")
+        _print(f"--- Day {day} ---")
         daily_report = party.daily_party_update(
             food_available=1.0,  # Very little food
             rationing_level=0.5,  # Half rations
             rest_hours=6,  # Poor rest
             rest_quality=0.8,
-            weather="fair",
+            weather=Weather.CLEAR,
             shelter_quality=1.0,
             medicine_used=0
         )
         
-        print(f"Food per person: {daily_report['food_distribution'].get('food_per_person', 0):.2f} lbs")
-        print(f"Average Health: {daily_report['party_status']['average_health']}")
+        _print(f"Food per person: {daily_report['food_distribution'].get('food_per_person', 0):.2f} lbs")
+        _print(f"Average Health: {daily_report['party_status']['average_health']}")
         
         if daily_report['deaths_today']:
-            print(f"Deaths today: {', '.join(daily_report['deaths_today'])}")
+            _print(f"Deaths today: {', '.join(daily_report['deaths_today'])}")
         
         if daily_report['game_over']:
-            print("GAME OVER!")
+            _print("GAME OVER!")
             break
-        print()
+        _print()
     
-    print("Final status after starvation:")
-    print(party.get_detailed_party_report())
-    print("\n" + "="*50 + "\n")
+    _print("Final status after starvation:")
+    _print(party.get_detailed_party_report())
+    _print("\n" + "="*50 + "\n")
+    _flush()
 
 
 def demo_weather_exposure():
     """Demo weather exposure effects"""
-    print("=== WEATHER EXPOSURE DEMO ===")
+    _print("=== WEATHER EXPOSURE DEMO ===")
     party = Party("Sarah", 28, "Solo Traveler")  # Solo traveler has health penalty
     
-    print("Starting weather exposure scenario...")
-    print(party.get_detailed_party_report())
-    print()
+    _print("Starting weather exposure scenario...")
+    _print(party.get_detailed_party_report())
+    _print()
     
-    weather_sequence = ["rain", "cold", "storm", "snow", "hot", "fair"]
+    weather_sequence = [Weather.RAIN, Weather.COLD, Weather.STORM, Weather.SNOW, Weather.HOT, Weather.CLEAR]
     
     for day, weather in enumerate(weather_sequence, 1):
-        print(f"--- Day {day} - Weather: {weather} ---")
+        _print(f"--- Day {day} - Weather: {weather.label} ---")
         daily_report = party.daily_party_update(
             food_available=2.5,  # Adequate food
             rationing_level=1.0,
             rest_hours=8,
             rest_quality=1.0,
             weather=weather,
-            shelter_quality=0.3 if weather in ["storm", "snow"] else 0.7,  # Poor shelter
+            shelter_quality=0.3 if weather in (Weather.STORM, Weather.SNOW) else 0.7,  # Poor shelter
             medicine_used=0
         )
         
-        print(f"Health: {daily_report['party_status']['average_health']}")
+        _print(f"Health: {daily_report['party_status']['average_health']}")
         
         # Show member conditions
         for member in party.get_living_members():
-            conditions = [c.value for c in member.health_system.conditions if c != HealthCondition.HEALTHY]
+            conditions = [c.label for c in member.health_system.active_conditions()]
             if conditions:
-                print(f"  {member.name}: {', '.join(conditions)}")
+                _print(f"  {member.name}: {', '.join(conditions)}")
         
         if daily_report['game_over']:
-            print("GAME OVER!")
+            _print("GAME OVER!")
             break
-        print()
+        _print()
     
-    print("Final status after weather exposure:")
-    print(party.get_detailed_party_report())
-    print("\n" + "="*50 + "\n")
+    _print("Final status after weather exposure:")
+    _print(party.get_detailed_party_report())
+    _print("\n" + "="*50 + "\n")
+    _flush()
 
 
 def demo_medicine_treatment():
     """Demo disease and medicine treatment"""
-    print("=== MEDICINE TREATMENT DEMO ===")
+    _print("=== MEDICINE TREATMENT DEMO ===")
     party = Party("Doc", 45, "Doctor")  # Doctor has health bonus
     party.add_member("Patient", 30, "Farmer")
     
-    print("Starting medicine treatment scenario...")
+    _print("Starting medicine treatment scenario...")
     
     # Manually add some conditions to demonstrate treatment
     party.members[1].health_system.add_condition(HealthCondition.SICK, 5)
     party.members[1].health_system.add_condition(HealthCondition.FEVERISH, 3)
     party.members[1].health_system.modify_health(-30, "Initial sickness")
-    party.members[1].health = party.members[1].health_system.current_health
     
-    print(party.get_detailed_party_report())
-    print()
+    _print(party.get_detailed_party_report())
+    _print()
     
     # Simulate treatment over several days
     for day in range(1, 8):
-        print(f"--- Day {day} ---")
+        _print(f"--- Day {day} ---")
         medicine_to_use = 1 if day <= 3 else 0  # Use medicine first 3 days
         
         daily_report = party.daily_party_update(
@@ -160,28 +183,29 @@ def demo_medicine_treatment():
             rationing_level=1.2,  # Extra rations for recovery
             rest_hours=10,  # Extra rest
             rest_quality=1.2,
-            weather="fair",
+            weather=Weather.CLEAR,
             shelter_quality=1.0,
             medicine_used=medicine_to_use
         )
         
-        print(f"Medicine used: {daily_report['treatment']['medicine_used']}")
-        print(f"Members treated: {daily_report['treatment']['members_treated']}")
+        _print(f"Medicine used: {daily_report['treatment']['medicine_used']}")
+        _print(f"Members treated: {daily_report['treatment']['members_treated']}")
         
         for member in party.get_living_members():
-            conditions = [c.value for c in member.health_system.conditions if c != HealthCondition.HEALTHY]
+            conditions = [c.label for c in member.health_system.active_conditions()]
             condition_str = f" ({', '.join(conditions)})" if conditions else " (Healthy)"
-            print(f"  {member.name}: {member.health}/100{condition_str}")
-        print()
+            _print(f"  {member.name}: {member.health}/100{condition_str}")
+        _print()
     
-    print("Final status after treatment:")
-    print(party.get_detailed_party_report())
-    print("\n" + "="*50 + "\n")
+    _print("Final status after treatment:")
+    _print(party.get_detailed_party_report())
+    _print("\n" + "="*50 + "\n")
+    _flush()
 
 
 def demo_profession_differences():
     """Demo how different professions handle health differently"""
-    print("=== PROFESSION DIFFERENCES DEMO ===")
+    _print("=== PROFESSION DIFFERENCES DEMO ===")
     
     # Create parties with different professions
     parties = {
@@ -190,38 +214,73 @@ def demo_profession_differences():
         "Solo Traveler": Party("Lone Wolf", 30, "Solo Traveler")
     }
     
-    print("Initial health values by profession:")
+    _print("Initial health values by profession:")
     for prof, party in parties.items():
         member = party.members[0]
-        print(f"{prof}: {member.health}/100 (max: {member.health_system.max_health})")
-    print()
+        _print(f"{prof}: {member.health}/100 (max: {member.health_system.max_health})")
+    _print()
     
     # Simulate harsh conditions for all
     for day in range(1, 6):
-        print(f"--- Day {day} ---")
+        _print(f"--- Day {day} ---")
         for prof, party in parties.items():
             daily_report = party.daily_party_update(
                 food_available=1.5,  # Limited food
                 rationing_level=0.8,
                 rest_hours=6,
                 rest_quality=0.7,
-                weather="cold",
+                weather=Weather.COLD,
                 shelter_quality=0.6,
                 medicine_used=0
             )
             
             member = party.members[0]
-            print(f"{prof}: {member.health}/100")
-        print()
+            _print(f"{prof}: {member.health}/100")
+        _print()
     
-    print("Final health comparison:")
+    _print("Final health comparison:")
     for prof, party in parties.items():
         member = party.members[0]
-        print(f"{prof}: {member.health}/100 - {member.health_system.get_status().value}")
-    print("\n" + "="*50 + "\n")
+        _print(f"{prof}: {member.health}/100 - {member.health_system.get_status().label}")
+    _print("\n" + "="*50 + "\n")
+    _flush()
+
+
+def demo_survival_odds():
+    """Demo estimating survival odds by simulating many copies of one party"""
+    _print("=== SURVIVAL ODDS DEMO ===")
+    members = [("John", 35, "Farmer"), ("Mary", 32, "Doctor"), ("Tommy", 12, "Farmer")]
+    _print("Simulating 500 parties of 3 through 20 days of storms with some shelter...")
+    
+    # Every simulated day would log its health changes - hide them during the batch
+    logging.disable(logging.INFO)
+    try:
+        survivors = simulate_batch(
+            500, 20, members,
+            food_available=9.0,  # Enough food for everyone
+            rationing_level=1.0,
+            rest_hours=8,
+            rest_quality=1.0,
+            weather=Weather.STORM,
+            shelter_quality=0.5,
+            medicine_used=0
+        )
+    finally:
+        logging.disable(logging.NOTSET)  # Turn logging back on
+    
+    _print("Chance of each number of survivors:")
+    for alive, fraction in survival_distribution(survivors).items():
+        # {fraction:.0%} shows 0.446 as "45%"
+        _print(f"  {alive} survivor(s): {fraction:.0%}")
+    _print("\n" + "="*50 + "\n")
+    _flush()
 
 
 if __name__ == "__main__":
+    # Show health change messages from the health system alongside the demo output
+    # (they go into the same buffer, so they stay in order with the demo text)
+    logging.basicConfig(level=logging.INFO, format="%(message)s", stream=_buf)
+    
     print("OREGON TRAIL HEALTH SYSTEM DEMONSTRATION")
     print("="*50)
     print()
@@ -232,10 +291,12 @@ if __name__ == "__main__":
         demo_weather_exposure()
         demo_medicine_treatment()
         demo_profession_differences()
+        demo_survival_odds()
         
         print("All demonstrations completed successfully!")
         
     except Exception as e:
+        _flush()  # Show whatever the failed demo printed before the error
         print(f"Error during demonstration: {e}")
         import traceback
         traceback.print_exc()
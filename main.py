@@ -2,16 +2,18 @@
 main.py - Simulates spoilage under specific weather and month conditions.
 """
 
-import os
+import logging
 import sys
+from types import MappingProxyType
 
-# Add classes directory to the module search path
-sys.path.append(os.path.join(os.path.dirname(__file__), 'classes'))
+from classes.person import Person
+from classes.wagon import Wagon
+from classes.inventory import Inventory
+from classes.item import ITEM_TYPES
 
-from person import Person
-from wagon import Wagon
-from inventory import Inventory
-from item import ITEM_TYPES
+# Weight of each item type, built once when the program starts
+# MappingProxyType makes it read-only so nothing can change it by accident
+_ITEM_WEIGHTS = MappingProxyType({k: v["weight"] for k, v in ITEM_TYPES.items()})
 
 def main():
     print("🧪 Spoilage Simulation Test: Default setup with weather/month factors")
@@ -19,7 +21,7 @@ def main():
     # Setup default player and wagon
     player = Person(name="Bob", age=22, profession="Farmer")
     wagon = Wagon(wagon_type="Basic")
-    inventory = Inventory()
+    inventory = Inventory(item_weights=_ITEM_WEIGHTS, verbose=True)
 
     # Add items
     print("\n📦 Adding 20 units of food...")
@@ -40,8 +42,8 @@ def main():
     inventory.list_inventory()
 
     # Load wagon and show status
-    item_weights = {k: v["weight"] for k, v in ITEM_TYPES.items()}
-    total_weight = inventory.total_weight(item_weights)
+    # (the inventory kept a running total with the same weights, so this is instant)
+    total_weight = inventory.total_weight(_ITEM_WEIGHTS)
     wagon.add_cargo(total_weight)
 
     print(f"\n⚖️ Total Inventory Weight: {total_weight} lbs")
@@ -49,4 +51,6 @@ def main():
     print(wagon)
 
 if __name__ == "__main__":
+    # Show inventory messages alongside the simulation output
+    logging.basicConfig(level=logging.INFO, format="%(message)s", stream=sys.stdout)
     main()